@@ -85,56 +85,34 @@ def send_quiz_question():
     )
 
 @app.on("mcq_question")
-def on_mcq_question_ui(message):
+def on_mcq_question_ui(message: CustomUIElementMessage):
     """
     Event handler for MCQ (Multiple Choice Question) responses.
     
     This function processes user responses to multiple-choice quiz questions.
-    It supports two different message formats:
-    1. Dictionary format (for direct API responses)
-    2. Pydantic model format (for parsed responses)
-    
     The handler provides appropriate feedback based on the selected answer,
     with index 2 ("Strong static typing") being the correct answer.
     
     Args:
-        message: A message object containing the user's MCQ selection, either
-            as a dictionary or as a parsed Pydantic model.
+        message (CustomUIElementMessage): The UI element response, whose
+            content.data is the parsed MCQQuestionResponseData.
             
     Raises:
         Exception: Logs any errors that occur during processing.
     """
     try:
-        if isinstance(message, dict) and 'data' in message:
-            mcq_data = message['data']
-            selected_option = mcq_data.get('selectedOption')
-            selected_index = mcq_data.get('selectedIndex')
-            question_id = mcq_data.get('id')
-            
-            logger.info(f"MCQ selection: '{selected_option}' (index: {selected_index}) for question {question_id}")
-            
-            # Check if answer is correct (option "Strong static typing" is the correct answer)
-            if selected_index == 2:
-                app.send_generated_text("Correct! Python has dynamic typing, not static typing.", is_generation_end=True)
-            else:
-                app.send_generated_text(f"Not quite. '{selected_option}' is indeed a feature of Python. 'Strong static typing' is not a Python feature.", is_generation_end=True)
-                
-        elif hasattr(message, 'content') and hasattr(message.content, 'data'):
-            # Handle as properly parsed Pydantic model
-            mcq_data = message.content.data
-            selected_option = mcq_data.selectedOption
-            selected_index = mcq_data.selectedIndex
-            question_id = mcq_data.id
-            
-            logger.info(f"MCQ selection: '{selected_option}' (index: {selected_index}) for question {question_id}")
-            
-            # Check if answer is correct (option "Strong static typing" is the correct answer)
-            if selected_index == 2:
-                app.send_generated_text("Correct! Python has dynamic typing, not static typing.", is_generation_end=True)
-            else:
-                app.send_generated_text(f"Not quite. '{selected_option}' is indeed a feature of Python. 'Strong static typing' is not a Python feature.", is_generation_end=True)
+        mcq_data = message.content.data
+        selected_option = mcq_data.selectedOption
+        selected_index = mcq_data.selectedIndex
+        question_id = mcq_data.id
+        
+        logger.info(f"MCQ selection: '{selected_option}' (index: {selected_index}) for question {question_id}")
+        
+        # Check if answer is correct (option "Strong static typing" is the correct answer)
+        if selected_index == 2:
+            app.send_generated_text("Correct! Python has dynamic typing, not static typing.", is_generation_end=True)
         else:
-            logger.error(f"Unexpected message format: {type(message)}")
+            app.send_generated_text(f"Not quite. '{selected_option}' is indeed a feature of Python. 'Strong static typing' is not a Python feature.", is_generation_end=True)
     except Exception as e:
         logger.error(f"Error handling MCQ question: {str(e)}")
 
@@ -184,29 +162,21 @@ def on_user_exit(message: ExitMessage):
         logger.error(f"Error handling exit event: {str(e)}")
 
 @app.on_connection_rejected()
-def on_reject(message):
+def on_reject(message: ConnectionRejectedMessage):
     """
     Event handler for connection rejection events.
     
     This function is triggered when a connection attempt to the Framewise API is rejected.
-    It handles rejection messages in both object format and dictionary format, extracting
-    the rejection reason and logging it for troubleshooting.
+    It logs the rejection reason for troubleshooting.
     
     Args:
-        message: A message object containing the rejection reason, either as a
-            structured object or as a dictionary.
+        message (ConnectionRejectedMessage): A message object containing the rejection reason.
             
     Raises:
         Exception: Logs any errors that occur during processing.
     """
     try:
-        if hasattr(message, 'content') and hasattr(message.content, 'reason'):
-            reason = message.content.reason
-        elif isinstance(message, dict) and 'content' in message:
-            reason = message['content'].get('reason', 'unknown')
-        else:
-            reason = "unknown"
-        logger.error(f"Connection rejected: {reason}")
+        logger.error(f"Connection rejected: {message.content.reason}")
     except Exception as e:
         logger.error(f"Error handling connection rejection: {str(e)}")
 
@@ -1,16 +1,123 @@
 import asyncio
-import json
 import logging
+import random
+import signal
 import sys
+import time
+import types
 import websockets
 import importlib
 import multiprocessing
-from typing import Dict, Optional, Any, Callable, Union
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Deque, Dict, List, Optional, Any, Callable, Set, Union
 from .errors import ConnectionError, AuthenticationError
+from .serialization import JSONDecodeError, dumps, loads
 import subprocess
 
 logger = logging.getLogger("AgentConnector")
 
+
+class AgentState(Enum):
+    """Lifecycle states of an agent started by the AgentConnector."""
+
+    SPAWNED = "spawned"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+
+
+@dataclass
+class AgentRecord:
+    """
+    Bookkeeping for one agent started by the AgentConnector.
+
+    Attributes:
+        agent_name: Name of the agent that was started.
+        meeting_id: Meeting the agent was started for.
+        process: Process running the agent, once it has been started. None
+                 while the agent waits for a free process slot, and for
+                 agents running as tasks.
+        task: The asyncio task running the agent in the connector process,
+              for agents running as tasks.
+        state: Current lifecycle state of the agent.
+        started_at: Monotonic time at which the agent was submitted or, once
+                    running, at which it started running.
+    """
+
+    agent_name: str
+    meeting_id: str
+    process: Optional[multiprocessing.process.BaseProcess] = None
+    task: Optional[asyncio.Task] = None
+    state: AgentState = AgentState.SPAWNED
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Process ID of the agent's process, or None if it has none."""
+        return self.process.pid if self.process is not None else None
+
+    def done(self) -> bool:
+        """Return whether the agent has finished running."""
+        if self.task is not None:
+            return self.task.done()
+        return self.process is not None and self.process.exitcode is not None
+
+    def failed(self) -> bool:
+        """Return whether a finished agent was cancelled or ended with an error."""
+        if self.task is not None:
+            return self.task.cancelled() or self.task.exception() is not None
+        return self.process.exitcode != 0
+
+
+def _run_agent(
+    agent_name: str,
+    agent_value: Union[str, Any],
+    meeting_id: str,
+    log_level: Optional[str] = None,
+) -> None:
+    """
+    Run an agent for a single meeting in its own process.
+
+    This is a module-level function so that it can be the target of an agent
+    process regardless of the multiprocessing start method. The call blocks
+    until the agent's app stops running, and the process exits with it.
+
+    Args:
+        agent_name: Name of the agent, as registered with the connector.
+        agent_value: Module path or app object registered for the agent.
+        meeting_id: Meeting ID to connect the agent to.
+        log_level: Optional log level for the agent's app. None leaves the
+                   logging configuration inherited by the process unchanged.
+
+    Raises:
+        Exception: Any error raised by the agent is logged and re-raised so
+                   that the process exits with an error and the connector
+                   records the run as failed.
+    """
+    # A forked process inherits the connector's handlers; SIGTERM should end
+    # this process until the app's runner installs its graceful handler
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    try:
+        if isinstance(agent_value, str):
+            agent_value = importlib.import_module(agent_value)
+
+        if isinstance(agent_value, types.ModuleType):
+            if not hasattr(agent_value, 'app'):
+                raise AttributeError(f"Agent module {agent_name} does not have 'app' attribute")
+            app_object = agent_value.app
+        else:
+            app_object = agent_value
+
+        app_object.join_meeting(meeting_id)
+        app_object.run(log_level=log_level)
+    except Exception as e:
+        logger.error(f"Error in agent process: {str(e)}")
+        raise
+
 class AgentConnector:
     """
     Connector for agent management and coordination in the Framewise Meet system.
@@ -22,7 +129,8 @@ class AgentConnector:
     
     Key features:
     - WebSocket connection to the Framewise backend for receiving agent commands
-    - Dynamic agent process management with multiprocessing
+    - Dynamic agent process management, one process per meeting, with agent
+      modules preloaded once in the connector when forking
     - Automatic reconnection with exponential backoff
     - Support for both module path-based and direct app object-based agent registration
     - Process tracking and cleanup
@@ -31,7 +139,36 @@ class AgentConnector:
     agent instances in response to meeting join events.
     """
     
-    def __init__(self, api_key: str, agent_modules: Dict[str, Union[str, Any]]):
+    # Maximum number of received messages waiting to be handled
+    INBOX_SIZE = 1024
+    # Maximum number of queued messages handled together
+    BATCH_SIZE = 64
+    # Seconds between scans for finished or expired agents
+    REAP_INTERVAL = 5
+    # Supported ways of running an agent
+    ISOLATION_MODES = ("process", "task")
+    # Seconds between keepalive pings, and to wait for their pong
+    PING_INTERVAL = 20
+    PING_TIMEOUT = 10
+    # Largest accepted WebSocket message, in bytes
+    MAX_MESSAGE_SIZE = 2**20
+    # Seconds a timed out agent has to stop before its process is killed
+    STOP_GRACE_PERIOD = 10
+    # Default number of agent processes running at once. Agents mostly wait on
+    # network I/O, so this is sized by concurrent meetings rather than CPUs
+    DEFAULT_MAX_WORKERS = 32
+    
+    def __init__(
+        self,
+        api_key: str,
+        agent_modules: Dict[str, Union[str, Any]],
+        max_workers: Optional[int] = None,
+        max_agent_lifetime: Optional[float] = None,
+        isolation: str = "process",
+        start_method: Optional[str] = None,
+        max_agents: Optional[int] = None,
+        agent_log_level: Optional[str] = None,
+    ):
         """
         Initialize the agent connector with authentication and agent configuration.
         
@@ -44,22 +181,116 @@ class AgentConnector:
                           - app objects (direct references) that will be used directly
                           
                           Example: {"quiz_agent": "myagents.quiz", "support_agent": app_instance}
+            max_workers: Maximum number of agent processes running at the same time.
+                        Further agents wait until one of them finishes, which is
+                        logged as a warning. Defaults to DEFAULT_MAX_WORKERS.
+            max_agent_lifetime: Optional maximum number of seconds an agent may run
+                               before it is asked to stop and marked TIMED_OUT. Time
+                               spent waiting for a free process slot is not counted.
+                               An agent process that has not stopped STOP_GRACE_PERIOD
+                               seconds later is killed. None means no limit.
+            isolation: How agents are run. "process" (the default) runs each agent
+                      in its own process. "task" runs agents as asyncio tasks on
+                      the connector's event loop, which avoids process startup but
+                      shares the connector process; use it for I/O-bound agents
+                      only. An app object can serve one meeting at a time as a task,
+                      so further meetings for a busy agent get their own process.
+            start_method: Multiprocessing start method for agent processes ("fork",
+                         "spawn" or "forkserver"). Defaults to the platform default.
+                         Only "fork" lets agent processes inherit app objects; with
+                         the other methods, app objects are pickled to each process,
+                         and the script that creates the connector must be guarded by
+                         `if __name__ == "__main__":`.
+            max_agents: Optional maximum number of agents that may be running or
+                       waiting for a process slot at the same time. Further start
+                       commands are rejected, and the backend is told so it can retry
+                       elsewhere. None means start commands wait without limit until
+                       a process slot is free.
+            agent_log_level: Optional log level (DEBUG, INFO, WARNING, ERROR,
+                            CRITICAL) set in agent processes before they run an
+                            agent. None leaves the logging configuration processes
+                            inherit unchanged. Agents run as tasks share the
+                            connector's logging and are not affected.
+        
+        Raises:
+            ValueError: If isolation is not one of ISOLATION_MODES.
         """
+        if isolation not in self.ISOLATION_MODES:
+            raise ValueError(
+                f"Invalid isolation mode: {isolation}, expected one of {self.ISOLATION_MODES}"
+            )
+
         self.api_key = api_key
         self.ws_url = f"wss://backend.framewise.ai/ws/api_key/{api_key}"
         self.running = False
-        self.active_agents = {}  # Keep track of running agent processes
-        self.agent_modules = agent_modules
+        self.active_agents: Dict[str, AgentRecord] = {}  # Keep track of running agents
+        self.agent_modules = dict(agent_modules)
         self.websocket = None
         self.command = None
-        
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+        self.max_agent_lifetime = max_agent_lifetime
+        self.isolation = isolation
+        self.max_agents = max_agents
+        self.agent_log_level = agent_log_level
+        # IDs of agents waiting for a free process slot, in arrival order
+        self._pending: Deque[str] = deque()
+        # Tasks enforcing max_agent_lifetime, one per active agent
+        self._watchdogs: Set[asyncio.Task] = set()
+        self._mp_context = multiprocessing.get_context(start_method)
+        if self._mp_context.get_start_method() != "fork" and any(
+            not isinstance(value, str) for value in self.agent_modules.values()
+        ):
+            logger.warning(
+                f"Agents registered as app objects are pickled to each agent process with "
+                f"the '{self._mp_context.get_start_method()}' start method. Register them by "
+                f"module path, and guard the entry point with if __name__ == \"__main__\":"
+            )
+        # App objects of module-path agents, imported for running them as tasks
+        self._task_agents: Dict[str, Any] = {}
+        for name in self.agent_modules:
+            self._preload_agent(name)
+
+    def _preload_agent(self, name: str) -> None:
+        """
+        Import a module-path agent once in the connector process.
+
+        With the fork start method, agent processes inherit the already
+        imported module and its app object, so agent code is loaded a single
+        time instead of once per meeting. Other start methods cannot hand app
+        objects to agent processes, so the module path is kept and imported
+        by each process. With task isolation the agent is imported here either
+        way, so starting it never blocks the event loop on an import.
+
+        Args:
+            name: Agent name whose registered value should be preloaded.
+        """
+        self._task_agents.pop(name, None)
+        value = self.agent_modules[name]
+        fork = self._mp_context.get_start_method() == "fork"
+        if not isinstance(value, str) or not (fork or self.isolation == "task"):
+            return
+
+        try:
+            agent_module = importlib.import_module(value)
+        except Exception as e:
+            logger.error(f"Failed to import agent module {value}: {str(e)}")
+            return
+
+        if not hasattr(agent_module, 'app'):
+            logger.error(f"Agent module {name} does not have 'app' attribute")
+        elif fork:
+            self.agent_modules[name] = agent_module.app
+        else:
+            self._task_agents[name] = agent_module.app
+
     async def connect_and_listen(self):
         """
         Connect to the WebSocket endpoint and listen for agent start commands.
         
         This method establishes a persistent WebSocket connection to the Framewise
         backend and listens for incoming commands. It implements an exponential
-        backoff reconnection strategy to handle temporary connection failures.
+        backoff reconnection strategy with jitter to handle temporary connection
+        failures, and detects dead connections with keepalive pings.
         
         The method runs indefinitely until the connector is explicitly stopped,
         providing continuous service for agent management.
@@ -74,30 +305,171 @@ class AgentConnector:
         reconnect_delay = 1
         max_reconnect_delay = 60
         
-        while self.running:
-            try:
-                async with websockets.connect(self.ws_url) as websocket:
-                    self.websocket = websocket
-                    logger.info("Successfully connected to WebSocket")
-                    reconnect_delay = 1
-                    
-                    while self.running:
-                        try:
-                            message = await websocket.recv()
-                            await self.handle_message(message)
-                        except websockets.exceptions.ConnectionClosed:
-                            logger.error("WebSocket connection closed")
-                            break
-                        except Exception as e:
-                            logger.error(f"Error receiving/handling message: {str(e)}")
-                            break
-                    
-            except Exception as e:
-                logger.error(f"WebSocket connection error: {str(e)}")
-                if self.running:
-                    logger.info(f"Reconnecting in {reconnect_delay} seconds...")
-                    await asyncio.sleep(reconnect_delay)
-                    reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+        # Receiving only enqueues messages; a separate task handles them so a
+        # slow message never stalls reading from the socket.
+        self._inbox = asyncio.Queue(maxsize=self.INBOX_SIZE)
+        drain_task = asyncio.create_task(self._drain())
+        reaper_task = asyncio.create_task(self._reaper())
+        
+        try:
+            while self.running:
+                try:
+                    # Start commands are small JSON messages, so compression would
+                    # cost more CPU than it saves bandwidth
+                    async with websockets.connect(
+                        self.ws_url,
+                        ping_interval=self.PING_INTERVAL,
+                        ping_timeout=self.PING_TIMEOUT,
+                        max_size=self.MAX_MESSAGE_SIZE,
+                        compression=None,
+                    ) as websocket:
+                        self.websocket = websocket
+                        logger.info("Successfully connected to WebSocket")
+                        reconnect_delay = 1
+                        
+                        while self.running:
+                            try:
+                                await self._inbox.put(await websocket.recv())
+                            except websockets.exceptions.ConnectionClosed:
+                                logger.error("WebSocket connection closed")
+                                break
+                            except Exception as e:
+                                logger.error(f"Error receiving message: {str(e)}")
+                                break
+                        
+                except Exception as e:
+                    logger.error(f"WebSocket connection error: {str(e)}")
+                    if self.running:
+                        # Jitter the delay so connectors don't reconnect in lockstep
+                        # after a shared outage
+                        delay = reconnect_delay * (0.5 + random.random())
+                        logger.info("Reconnecting in %.1f seconds...", delay)
+                        await asyncio.sleep(delay)
+                        reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+        finally:
+            drain_task.cancel()
+            reaper_task.cancel()
+    
+    async def _drain(self):
+        """
+        Handle queued WebSocket messages in batches.
+        
+        Waits for at least one message, then takes whatever else is already
+        queued (up to BATCH_SIZE) and handles the whole batch together. Runs
+        until cancelled by connect_and_listen.
+        """
+        while True:
+            messages = [await self._inbox.get()]
+            while not self._inbox.empty() and len(messages) < self.BATCH_SIZE:
+                messages.append(self._inbox.get_nowait())
+            await self.handle_messages(messages)
+    
+    async def _reaper(self):
+        """
+        Periodically reap finished agents.
+        
+        Runs every REAP_INTERVAL seconds until cancelled by connect_and_listen.
+        """
+        while True:
+            await asyncio.sleep(self.REAP_INTERVAL)
+            self.reap_agents()
+    
+    def reap_agents(self) -> None:
+        """
+        Update the lifecycle state of tracked agents and drop finished ones.
+        
+        This method:
+        1. Removes agents that are done from active_agents, logging whether
+           they COMPLETED, FAILED or TIMED_OUT
+        2. Starts agents that were waiting for the process slots this freed
+        """
+        for process_id, record in list(self.active_agents.items()):
+            if record.done():
+                if record.state is not AgentState.TIMED_OUT:
+                    record.state = AgentState.FAILED if record.failed() else AgentState.COMPLETED
+                logger.info(f"Agent process {process_id} finished: {record.state.value}")
+                del self.active_agents[process_id]
+        
+        self._start_pending()
+    
+    async def _enforce_lifetime(self, process_id: str, record: AgentRecord) -> None:
+        """
+        Stop an agent that is still running max_agent_lifetime seconds after it
+        started running.
+        
+        Time spent waiting for a free process slot does not count towards the
+        lifetime. The agent is checked at least every REAP_INTERVAL seconds,
+        so this returns soon after it finishes. An agent process that is asked
+        to stop and is still running STOP_GRACE_PERIOD seconds later is killed.
+        
+        Args:
+            process_id: Connector-side identifier of the agent run.
+            record: The run's record in active_agents.
+        """
+        while not record.done():
+            remaining = self.REAP_INTERVAL
+            if record.state is AgentState.RUNNING:
+                remaining = self.max_agent_lifetime - (time.monotonic() - record.started_at)
+                if remaining <= 0:
+                    break
+            await asyncio.sleep(min(remaining, self.REAP_INTERVAL))
+        else:
+            return
+        
+        self._stop_agent(process_id, record)
+        if record.process is None:
+            return
+        
+        await asyncio.sleep(self.STOP_GRACE_PERIOD)
+        if not record.done():
+            self._kill_agent(process_id, record)
+    
+    def _stop_agent(self, process_id: str, record: AgentRecord) -> None:
+        """
+        Ask a running agent to stop and mark it TIMED_OUT.
+        
+        Agents running as tasks are cancelled. Agents running in a process are
+        sent SIGTERM, which lets their app shut down gracefully. Each agent
+        has a process of its own, so no other agent is affected.
+        
+        Args:
+            process_id: Connector-side identifier of the agent run.
+            record: The run's record in active_agents.
+        """
+        logger.warning(
+            f"Agent process {process_id} exceeded its lifetime: "
+            f"{record.state.value} -> {AgentState.TIMED_OUT.value}"
+        )
+        record.state = AgentState.TIMED_OUT
+        
+        if record.task is not None:
+            record.task.cancel()
+        else:
+            record.process.terminate()
+    
+    def _kill_agent(self, process_id: str, record: AgentRecord) -> None:
+        """
+        Kill the process of an agent that did not stop within STOP_GRACE_PERIOD.
+        
+        Args:
+            process_id: Connector-side identifier of the agent run.
+            record: The run's record in active_agents.
+        """
+        logger.error(
+            f"Agent process {process_id} did not stop within {self.STOP_GRACE_PERIOD} "
+            f"seconds, killing process {record.pid}"
+        )
+        record.process.kill()
+    
+    async def handle_messages(self, messages_raw: List[Union[str, bytes]]):
+        """
+        Process a batch of received WebSocket messages in arrival order.
+        
+        Args:
+            messages_raw: Raw message strings from the WebSocket connection.
+        """
+        for message_raw in messages_raw:
+            await self.handle_message(message_raw)
     
     async def handle_message(self, message_raw):
         """
@@ -116,25 +488,90 @@ class AgentConnector:
             to prevent the WebSocket connection from terminating.
         """
         try:
-            message = json.loads(message_raw)
-            logger.info(f"Received message: {message}")
+            message = loads(message_raw)
+            # Accepted commands are logged when the agent starts
+            logger.debug("Received message: %s", message)
             
             agent_name = message.get("agent_name")
             meeting_id = message.get("meeting_id")
             
             if agent_name and meeting_id:
+                if self._is_active(agent_name, meeting_id):
+                    logger.info(f"Agent {agent_name} is already active for meeting {meeting_id}")
+                    return
+                
+                if self.at_capacity():
+                    logger.warning(
+                        f"Rejecting agent {agent_name} for meeting {meeting_id}: "
+                        f"{self.max_agents} agents already active"
+                    )
+                    await self._send_start_rejected(agent_name, meeting_id, "max_agents_reached")
+                    return
+                
                 logger.info(f"Starting agent {agent_name} for meeting {meeting_id}")
-                # Always create a new process, don't reuse existing ones
-                self.command_manager(meeting_id=meeting_id)
+                if self.command:
+                    # Run the blocking command off the event loop
+                    await asyncio.to_thread(self.command_manager, meeting_id)
                 self.start_agent_process(agent_name, meeting_id)
             else:
-                logger.warning(f"Received message without agent_name or meeting_id: {message}")
+                logger.warning("Received message without agent_name or meeting_id: %s", message)
                 
-        except json.JSONDecodeError:
+        except JSONDecodeError:
             logger.error(f"Failed to parse message: {message_raw}")
         except Exception as e:
             logger.error(f"Error handling message: {str(e)}")
     
+    def at_capacity(self) -> bool:
+        """
+        Check whether the connector is running max_agents agents already.
+        
+        Returns:
+            bool: True if max_agents is set and that many agents are running or
+                  waiting for a process slot, False otherwise.
+        """
+        if self.max_agents is None:
+            return False
+        active = sum(1 for record in self.active_agents.values() if not record.done())
+        return active >= self.max_agents
+    
+    def _is_active(self, agent_name: str, meeting_id: str) -> bool:
+        """
+        Check whether an agent is running or waiting to run for a meeting.
+        
+        Args:
+            agent_name: Name of the agent.
+            meeting_id: Meeting ID the agent was started for.
+            
+        Returns:
+            bool: True if such an agent has been started and not finished.
+        """
+        return any(
+            record.agent_name == agent_name and record.meeting_id == meeting_id and not record.done()
+            for record in self.active_agents.values()
+        )
+    
+    async def _send_start_rejected(self, agent_name: str, meeting_id: str, reason: str):
+        """
+        Tell the backend that an agent start command was rejected.
+        
+        Args:
+            agent_name: Name of the agent that was not started.
+            meeting_id: Meeting the agent was requested for.
+            reason: Machine-readable reason for the rejection.
+        """
+        if self.websocket is None:
+            return
+        
+        try:
+            await self.websocket.send(dumps({
+                "type": "agent_start_rejected",
+                "agent_name": agent_name,
+                "meeting_id": meeting_id,
+                "reason": reason,
+            }))
+        except Exception as e:
+            logger.error(f"Error sending start rejection: {str(e)}")
+    
     def command_manager(self, meeting_id):
         """Execute a system command with meeting_id as an argument.
         
@@ -169,9 +606,10 @@ class AgentConnector:
         """
         Start an agent in a separate process to handle a specific meeting.
         
-        This method creates a new process for the requested agent and meeting,
-        either by dynamically importing a module or using a directly provided
-        app object. The agent process is tracked for lifecycle management.
+        This method starts a new process for the requested agent and meeting,
+        which either imports the agent's module or uses the directly provided
+        (or, with the fork start method, preloaded) app object. The process is
+        tracked for lifecycle management.
         
         Args:
             agent_name: Name of the agent to start, must match a key in agent_modules.
@@ -182,66 +620,170 @@ class AgentConnector:
             
         Note:
             Each agent process is isolated and runs independently, which prevents
-            issues in one agent from affecting others. The process is tracked in
-            the active_agents dictionary for later cleanup.
+            issues in one agent from affecting others. When max_workers agent
+            processes are already running, the agent waits until one of them
+            finishes. The agent is tracked in the active_agents dictionary and
+            reaped once it finishes.
         """
         if agent_name not in self.agent_modules:
             logger.error(f"Unknown agent: {agent_name}")
             return False
         
+        if self._is_active(agent_name, meeting_id):
+            logger.warning(f"Agent {agent_name} is already active for meeting {meeting_id}")
+            return False
+        
+        if self.at_capacity():
+            logger.error(f"Cannot start agent {agent_name}: {self.max_agents} agents already active")
+            return False
+        
+        # Generate a unique ID for this agent instance
+        process_id = f"{agent_name}_{meeting_id}_{time.monotonic_ns()}"
+        
         try:
-            agent_value = self.agent_modules[agent_name]
+            if self.isolation == "task":
+                task = self._start_agent_task(agent_name, meeting_id)
+                if task is not None:
+                    self.active_agents[process_id] = AgentRecord(
+                        agent_name, meeting_id, task=task, state=AgentState.RUNNING
+                    )
+                    self._watch_lifetime(process_id)
+                    logger.info(f"Started agent task: {process_id}")
+                    return True
             
-            # Determine if the agent_value is a module path or an app object
-            if isinstance(agent_value, str):
-                # It's a module path, define the process function to import it
-                def run_agent_process():
-                    try:
-                        agent_module = importlib.import_module(agent_value)
-                        if hasattr(agent_module, 'app'):
-                            # Use app.join_meeting() instead of init_meeting()
-                            agent_module.app.join_meeting(meeting_id)
-                            agent_module.app.run(log_level="DEBUG")
-                        else:
-                            logger.error(f"Agent module {agent_name} does not have 'app' attribute")
-                    except Exception as e:
-                        logger.error(f"Error in agent process: {str(e)}")
+            # Track the agent
+            record = AgentRecord(agent_name, meeting_id)
+            self.active_agents[process_id] = record
+            if self._running_processes() < self.max_workers:
+                self._launch(process_id, record)
             else:
-                # It's an app object, define the process function to use it directly
-                def run_agent_process():
-                    try:
-                        # Use the app object directly
-                        app_object = agent_value
-                        app_object.join_meeting(meeting_id)
-                        app_object.run(log_level="DEBUG")
-                    except Exception as e:
-                        logger.error(f"Error in agent process: {str(e)}")
-            
-            # Start new process
-            process = multiprocessing.Process(target=run_agent_process)
-            process.daemon = True
-            process.start()
-            
-            # Generate a unique ID for this process instance
-            process_id = f"{agent_name}_{meeting_id}_{id(process)}"
-            
-            # Track the process
-            self.active_agents[process_id] = process
-            logger.info(f"Started agent process: {process_id}")
+                logger.warning(
+                    f"All {self.max_workers} agent processes are busy, agent {agent_name} "
+                    f"for meeting {meeting_id} waits for one to finish"
+                )
+                self._pending.append(process_id)
+            self._watch_lifetime(process_id)
             return True
             
         except Exception as e:
+            self.active_agents.pop(process_id, None)
             logger.error(f"Error starting agent {agent_name}: {str(e)}")
             return False
     
+    def _running_processes(self) -> int:
+        """Return the number of agent processes that have not finished."""
+        return sum(
+            1 for record in self.active_agents.values()
+            if record.process is not None and not record.done()
+        )
+    
+    def _launch(self, process_id: str, record: AgentRecord) -> None:
+        """
+        Start the process of an agent and mark the agent RUNNING.
+        
+        Args:
+            process_id: Connector-side identifier of the agent run.
+            record: The run's record in active_agents.
+        """
+        process = self._mp_context.Process(
+            target=_run_agent,
+            args=(
+                record.agent_name,
+                self.agent_modules[record.agent_name],
+                record.meeting_id,
+                self.agent_log_level,
+            ),
+            name=process_id,
+            daemon=True,
+        )
+        process.start()
+        record.process = process
+        record.state = AgentState.RUNNING
+        record.started_at = time.monotonic()
+        logger.info(f"Started agent process: {process_id}")
+    
+    def _start_pending(self) -> None:
+        """Start waiting agents, in arrival order, while process slots are free."""
+        while self._pending and self._running_processes() < self.max_workers:
+            process_id = self._pending.popleft()
+            record = self.active_agents.get(process_id)
+            if record is None:
+                continue
+            
+            try:
+                self._launch(process_id, record)
+            except Exception as e:
+                del self.active_agents[process_id]
+                logger.error(f"Error starting agent {record.agent_name}: {str(e)}")
+    
+    def _watch_lifetime(self, process_id: str) -> None:
+        """
+        Start enforcing max_agent_lifetime for a newly started agent.
+        
+        Args:
+            process_id: Connector-side identifier of the agent run.
+        """
+        if self.max_agent_lifetime is None:
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning(f"No running event loop, lifetime of {process_id} is not enforced")
+            return
+        
+        watchdog = loop.create_task(
+            self._enforce_lifetime(process_id, self.active_agents[process_id])
+        )
+        self._watchdogs.add(watchdog)
+        watchdog.add_done_callback(self._watchdogs.discard)
+    
+    def _start_agent_task(self, agent_name: str, meeting_id: str) -> Optional[asyncio.Task]:
+        """
+        Start an agent as a task on the connector's running event loop.
+        
+        Args:
+            agent_name: Name of the agent to start.
+            meeting_id: Meeting ID to connect the agent to.
+            
+        Returns:
+            The task running the agent, or None if the agent has to be run in
+            a process instead because there is no running event loop,
+            its module failed to import, or its app is already serving another
+            meeting.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        
+        agent_value = self._task_agents.get(agent_name, self.agent_modules[agent_name])
+        if isinstance(agent_value, str):
+            # The module failed to preload; let an agent process report the error
+            return None
+        
+        busy = any(
+            record.agent_name == agent_name
+            and record.task is not None
+            and not record.task.done()
+            for record in self.active_agents.values()
+        )
+        if busy:
+            logger.info(f"Agent {agent_name} is busy, running it in a separate process")
+            return None
+        
+        agent_value.join_meeting(meeting_id)
+        return loop.create_task(agent_value.run_async())
+    
     def stop(self):
         """
         Stop the connector and clean up all resources.
         
         This method:
         1. Sets the running flag to False to stop the main loop
-        2. Terminates all active agent processes
-        3. Clears the active_agents registry
+        2. Cancels agents running as tasks
+        3. Drops agents waiting for a process slot and terminates agent processes
+        4. Clears the active_agents registry
         
         It should be called when shutting down the application or when the
         connector is no longer needed to ensure proper resource cleanup.
@@ -249,11 +791,18 @@ class AgentConnector:
         logger.info("Stopping agent connector...")
         self.running = False
         
-        # Terminate any running agent processes
-        for process_id, process in self.active_agents.items():
-            if process.is_alive():
+        for watchdog in self._watchdogs:
+            watchdog.cancel()
+        
+        self._pending.clear()
+        
+        # Agents handle SIGTERM by stopping their app
+        for process_id, record in self.active_agents.items():
+            if record.task is not None:
+                record.task.cancel()
+            elif record.process is not None and record.process.is_alive():
                 logger.info(f"Terminating agent process: {process_id}")
-                process.terminate()
+                record.process.terminate()
                 
         self.active_agents.clear()
 
@@ -277,6 +826,7 @@ class AgentConnector:
             ```
         """
         self.agent_modules[name] = module_path_or_app_object
+        self._preload_agent(name)
         logger.info(f"Registered agent '{name}'")
         
     def unregister_agent(self, name: str):
@@ -292,9 +842,12 @@ class AgentConnector:
         """
         if name in self.agent_modules:
             del self.agent_modules[name]
+            self._task_agents.pop(name, None)
             logger.info(f"Unregistered agent '{name}'")
 
-async def run_agent_connector(api_key: str, agent_modules: Dict[str, Union[str, Any]]):
+async def run_agent_connector(
+    api_key: str, agent_modules: Dict[str, Union[str, Any]], **connector_options
+):
     """
     Run an agent connector instance as a standalone service.
     
@@ -305,6 +858,8 @@ async def run_agent_connector(api_key: str, agent_modules: Dict[str, Union[str,
     Args:
         api_key: API key for authentication with the Framewise backend.
         agent_modules: Mapping of agent names to either module paths (strings) or app objects.
+        **connector_options: Further keyword arguments for AgentConnector, such as
+                            max_workers or start_method.
         
     Example:
         ```python
@@ -315,7 +870,9 @@ async def run_agent_connector(api_key: str, agent_modules: Dict[str, Union[str,
         asyncio.run(run_agent_connector("api_key_12345", agent_modules))
         ```
     """
-    connector = AgentConnector(api_key=api_key, agent_modules=agent_modules)
+    connector = AgentConnector(
+        api_key=api_key, agent_modules=agent_modules, **connector_options
+    )
     
     try:
         await connector.connect_and_listen()
@@ -323,4 +880,4 @@ async def run_agent_connector(api_key: str, agent_modules: Dict[str, Union[str,
         logger.info("Received keyboard interrupt")
     finally:
         connector.stop()
-        await asyncio.sleep(1)  # Allow time for cleanup
\ No newline at end of file
+        await asyncio.sleep(1)  # Allow time for cleanup
@@ -1,5 +1,7 @@
 import asyncio
 import logging
+import os
+import time
 from typing import Dict, Any, List, Optional, Callable, Type, TypeVar, cast, Union
 from enum import Enum
 
@@ -46,6 +48,7 @@ from .models.outbound import (
     NotificationElement,
 )
 import datetime
+from types import MappingProxyType
 from .events import (
     TRANSCRIPT_EVENT,
     JOIN_EVENT,
@@ -64,6 +67,7 @@ from .events import (
 from .exceptions import InvalidMessageTypeError
 
 import requests
+from requests.adapters import HTTPAdapter
 from .auth import authenticate_api_key
 
 # Configure logging
@@ -85,6 +89,42 @@ class EventType(Enum):
 T = TypeVar("T", bound=BaseMessage)
 
 
+# Event names accepted by App.on and the on_<name> shorthands, mapped to event types
+EVENT_ALIASES = MappingProxyType({
+    "join": JOIN_EVENT,
+    "exit": EXIT_EVENT,
+    "transcript": TRANSCRIPT_EVENT,
+    "custom_ui_response": CUSTOM_UI_EVENT,
+    "custom_ui": CUSTOM_UI_EVENT,
+    "invoke": INVOKE_EVENT,
+    "connection_rejected": CONNECTION_REJECTED_EVENT,
+    "mcq_question": MCQ_QUESTION_EVENT,
+    "places_autocomplete": PLACES_AUTOCOMPLETE_EVENT,
+    "upload_file": UPLOAD_FILE_EVENT,
+    "textinput": TEXTINPUT_EVENT,
+    "consent_form": CONSENT_FORM_EVENT,
+    "calendly": CALENDLY_EVENT,
+})
+
+# Message class that handlers of each event type receive
+MESSAGE_TYPE_MAPPING = MappingProxyType({
+    JOIN_EVENT: JoinMessage,
+    EXIT_EVENT: ExitMessage,
+    TRANSCRIPT_EVENT: TranscriptMessage,
+    CUSTOM_UI_EVENT: CustomUIElementResponse,
+    INVOKE_EVENT: TranscriptMessage,  # Note: InvokeMessage is just TranscriptMessage with is_final=True
+    CONNECTION_REJECTED_EVENT: ConnectionRejectedMessage,
+    # UI element subtypes are dispatched with the whole UI response, whose
+    # data is parsed into the response model of the element type
+    MCQ_QUESTION_EVENT: CustomUIElementResponse,
+    PLACES_AUTOCOMPLETE_EVENT: CustomUIElementResponse,
+    UPLOAD_FILE_EVENT: CustomUIElementResponse,
+    TEXTINPUT_EVENT: CustomUIElementResponse,
+    CONSENT_FORM_EVENT: CustomUIElementResponse,
+    CALENDLY_EVENT: CustomUIElementResponse,
+})
+
+
 class App:
     """
     WebSocket client application with decorator-based event handling.
@@ -113,30 +153,12 @@ class App:
         ```
     """
 
-    _event_aliases = {
-        "join": JOIN_EVENT,
-        "exit": EXIT_EVENT,
-        "transcript": TRANSCRIPT_EVENT,
-        "custom_ui_response": CUSTOM_UI_EVENT,
-        "custom_ui": CUSTOM_UI_EVENT,
-        "invoke": INVOKE_EVENT,
-        "connection_rejected": CONNECTION_REJECTED_EVENT,
-        "mcq_question": MCQ_QUESTION_EVENT,
-        "places_autocomplete": PLACES_AUTOCOMPLETE_EVENT,
-        "upload_file": UPLOAD_FILE_EVENT,
-        "textinput": TEXTINPUT_EVENT,
-        "consent_form": CONSENT_FORM_EVENT,
-        "calendly": CALENDLY_EVENT,
-    }
-
-    _message_type_mapping = {
-        JOIN_EVENT: JoinMessage,
-        EXIT_EVENT: ExitMessage,
-        TRANSCRIPT_EVENT: TranscriptMessage,
-        CUSTOM_UI_EVENT: CustomUIElementResponse,
-        INVOKE_EVENT: TranscriptMessage,  # Note: InvokeMessage is just TranscriptMessage with is_final=True
-        CONNECTION_REJECTED_EVENT: ConnectionRejectedMessage,
-    }
+    # Kept as class attributes for code that looks the tables up through App
+    _event_aliases = EVENT_ALIASES
+    _message_type_mapping = MESSAGE_TYPE_MAPPING
+
+    # Seconds a successful API key check is reused for by later runs of the app
+    AUTH_CACHE_TTL = 300
 
     def __init__(
         self, api_key: Optional[str] = None, host: str = "localhost", port: int = 8000
@@ -156,12 +178,37 @@ class App:
         self.port = port
         self.api_key = api_key
         self.auth_status = None
+        # API key of the last successful check, and when that check expires
+        self._auth_key = None
+        self._auth_expiry = 0.0
         self.connection = None
         self.event_dispatcher = EventDispatcher()
         self.message_sender = None
         self.running = False
         self.loop = None
         self._main_task = None
+        # Shared HTTP session, created on first use by the _http property
+        self._http_session = None
+        self._http_pid = None
+
+    @property
+    def _http(self) -> requests.Session:
+        """
+        HTTP session for backend requests.
+
+        The session is shared so requests reuse pooled connections instead of
+        paying a TCP and TLS handshake each. It is created per process: a
+        forked agent worker gets a fresh session rather than sharing the
+        parent's pooled sockets.
+        """
+        pid = os.getpid()
+        if self._http_pid != pid:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+            session.headers.update({"accept": "application/json"})
+            self._http_session = session
+            self._http_pid = pid
+        return self._http_session
 
     def join_meeting(self, meeting_id):
         """
@@ -169,8 +216,8 @@ class App:
         
         This method initializes the WebSocket connection to the Framewise backend
         and connects the app to a specific meeting. It also sets up the MessageSender
-        and dynamically binds its methods to the App instance to provide message
-        sending capabilities.
+        and binds its send methods, listed in MessageSender.PROXIED_METHODS, to
+        the App instance to provide message sending capabilities.
         
         Args:
             meeting_id: Unique identifier for the meeting to join.
@@ -185,12 +232,8 @@ class App:
         )
         self.message_sender = MessageSender(self.connection)
 
-        for name in dir(self.message_sender):
-            if not name.startswith("_") and callable(
-                getattr(self.message_sender, name)
-            ):
-                logging.info(f"Set {name} in message_sender")
-                setattr(self, name, getattr(self.message_sender, name))
+        for name in MessageSender.PROXIED_METHODS:
+            setattr(self, name, getattr(self.message_sender, name))
 
     def on(self, event_type: str) -> Callable[[Callable[[BaseMessage], Any]], Callable[[BaseMessage], Any]]:
         """
@@ -202,7 +245,7 @@ class App:
         
         Args:
             event_type: The event type to register for (e.g., "transcript", "join", "exit").
-                      Can be either a direct event type or an alias defined in _event_aliases.
+                      Can be either a direct event type or an alias defined in EVENT_ALIASES.
             
         Returns:
             A decorator function that registers the decorated function as a handler
@@ -216,68 +259,25 @@ class App:
             ```
         """
         # Check if this is an alias and get the main event type
-        resolved_event_type = self._event_aliases.get(event_type, event_type)
+        resolved_event_type = EVENT_ALIASES.get(event_type, event_type)
         
         if resolved_event_type != event_type:
-            logger.debug(f"Resolved event alias '{event_type}' to standard event type '{resolved_event_type}'")
+            logger.debug("Resolved event alias '%s' to standard event type '%s'", event_type, resolved_event_type)
         
         # Get the correct message type for this event
-        message_class = self._message_type_mapping.get(resolved_event_type)
+        message_class = MESSAGE_TYPE_MAPPING.get(resolved_event_type)
         
         def decorator(func: Callable[[BaseMessage], Any]) -> Callable[[BaseMessage], Any]:
             if self.event_dispatcher is None:
                 self.event_dispatcher = EventDispatcher()
-                
-            # Create a wrapper that ensures type safety
-            def type_safe_handler(message: BaseMessage) -> Any:
-                # Verify we got the correct message type
-                if message_class and not isinstance(message, message_class):
-                    logger.error(f"Expected {message_class.__name__}, got {type(message).__name__}")
-                    return None
-                
-                return func(message)
-                
-            # Register the handler with the specified event type
-            self.event_dispatcher.register(resolved_event_type, type_safe_handler)
-            logger.debug(f"Registered handler {func.__name__} for event type {resolved_event_type}")
+
+            # The dispatcher checks the message type before calling the handler
+            self.event_dispatcher.register(resolved_event_type, func, message_class)
+            logger.debug("Registered handler %s for event type %s", func.__name__, resolved_event_type)
             return func
             
         return decorator
 
-    def __getattr__(self, name):
-        """
-        Dynamically create event handler registration methods.
-        
-        This magic method allows methods like on_transcript(), on_join(), etc. to be
-        generated dynamically when accessed, providing a more intuitive API for
-        registering event handlers.
-        
-        Args:
-            name: The attribute name being accessed.
-            
-        Returns:
-            A method that registers event handlers if the name follows the pattern
-            "on_<event_type>", otherwise raises AttributeError.
-            
-        Raises:
-            AttributeError: If the requested attribute doesn't follow the pattern
-                          "on_<event_type>" or if the event type is not recognized.
-        """
-        if name.startswith("on_"):
-            event_name = name[3:]
-
-            if event_name in self._event_aliases:
-                event_type_value = self._event_aliases[event_name]
-
-                def handler_method(func=None):
-                    return self._on_event(event_type_value, func, name)
-
-                return handler_method
-
-        raise AttributeError(
-            f"'{self.__class__.__name__}' object has no attribute '{name}'"
-        )
-
     def _on_event(
         self,
         event_type: Union[str, EventType],
@@ -287,8 +287,8 @@ class App:
         """
         Helper function to reduce code duplication in event registration.
         
-        This internal method is used by the dynamically generated event handler
-        registration methods to provide a consistent way to register handlers.
+        This internal method is used by the generated on_<alias> registration
+        methods to provide a consistent way to register handlers.
         
         Args:
             event_type: The type of event to register for, either as a string or an EventType enum.
@@ -304,7 +304,7 @@ class App:
         )
         if func is None:
             return self.on(event_type_value)
-        logger.debug(f"Using {shorthand_name} shorthand for {func.__name__}")
+        logger.debug("Using %s shorthand for %s", shorthand_name, func.__name__)
         return self.on(event_type_value)(func)
 
     def invoke(self, func: Callable[[TranscriptMessage], Any] = None):
@@ -345,6 +345,33 @@ class App:
             reconnect_delay: Delay between reconnection attempts in seconds
             log_level: Optional log level to set (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         """
+        self._set_log_level(log_level)
+        self._authenticate()
+        self._create_runner(auto_reconnect, reconnect_delay).run(self)
+
+    async def run_async(
+        self,
+        auto_reconnect: bool = True,
+        reconnect_delay: int = 5,
+        log_level: str = None,
+    ) -> None:
+        """Run the application on the current event loop.
+
+        Unlike run(), this does not create an event loop or install signal
+        handlers, so several apps can share the loop of their caller. Use
+        stop() or cancel the awaiting task to end it.
+
+        Args:
+            auto_reconnect: Whether to automatically reconnect on disconnect
+            reconnect_delay: Delay between reconnection attempts in seconds
+            log_level: Optional log level to set (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        """
+        self._set_log_level(log_level)
+        await asyncio.to_thread(self._authenticate)
+        await self._create_runner(auto_reconnect, reconnect_delay).run_async(self)
+
+    def _set_log_level(self, log_level: Optional[str]) -> None:
+        """Set the root log level if one is given."""
         if log_level:
             numeric_level = getattr(logging, log_level.upper(), None)
             if isinstance(numeric_level, int):
@@ -353,13 +380,24 @@ class App:
             else:
                 logger.warning(f"Invalid log level: {log_level}")
 
+    def _authenticate(self) -> None:
+        """Authenticate the API key, if any, before connecting.
+
+        A successful check is reused for AUTH_CACHE_TTL seconds, so running
+        the app again, e.g. for each meeting it joins, skips the request.
+        """
         if self.api_key:
+            if self._auth_key == self.api_key and time.monotonic() < self._auth_expiry:
+                logger.debug("Using cached API key authentication")
+                return
             try:
                 logger.info("Authenticating API key...")
-                self.auth_status = authenticate_api_key(self.api_key)
+                self.auth_status = authenticate_api_key(self.api_key, session=self._http)
                 if not self.auth_status:
                     logger.error("API key authentication failed")
                     raise AuthenticationError("API key authentication failed")
+                self._auth_key = self.api_key
+                self._auth_expiry = time.monotonic() + self.AUTH_CACHE_TTL
                 logger.info("API key authentication successful")
             except Exception as e:
                 logger.error(f"Authentication error: {str(e)}")
@@ -367,14 +405,15 @@ class App:
         else:
             logger.warning("No API key provided. Some features may be limited.")
 
+    def _create_runner(self, auto_reconnect: bool, reconnect_delay: int):
+        """Register the default handlers and create the runner for this app."""
         self._register_default_handlers()
 
         from .runner import AppRunner
 
-        runner = AppRunner(
+        return AppRunner(
             self.connection, self.event_dispatcher, auto_reconnect, reconnect_delay
         )
-        runner.run(self)
 
     # Update the default connection rejected handler with better error handling
     def _register_default_handlers(self):
@@ -395,9 +434,16 @@ class App:
         self.running = False
         logger.info("Application stopping...")
 
+        # Interrupt the main loop, which may be waiting for the next message
+        if self.loop is not None and self._main_task is not None:
+            self.loop.call_soon_threadsafe(self._main_task.cancel)
+
     def create_meeting(self, meeting_id: str, start_time=None, end_time=None):
         """Create a meeting with the given parameters.
 
+        This performs a blocking HTTP request; from a coroutine, use
+        create_meeting_async() instead so the event loop keeps running.
+
         Args:
             meeting_id: Unique identifier for the meeting
             start_time: Start time of the meeting as datetime object (defaults to current time)
@@ -407,25 +453,20 @@ class App:
         if not self.api_key:
             raise AuthenticationError("API key is required to create a meeting")
 
-        
-        
-
         url = "https://backend.framewise.ai/api/py/setup-meeting"
-        headers = {"accept": "application/json", "Content-Type": "application/json"}
         payload = {
             "meeting_id": meeting_id,
             "api_key": self.api_key,
         }
 
         if start_time is not None:
-            start_time_utc = start_time.isoformat() + "Z"
-            payload['start_time_utc'] = start_time_utc
+            payload['start_time_utc'] = self._format_utc(start_time)
 
         if end_time is not None:
-            end_time_utc = end_time.isoformat() + "Z"
-            payload['end_time_utc'] = end_time_utc
+            payload['end_time_utc'] = self._format_utc(end_time)
 
-        response = requests.post(url, headers=headers, json=payload)
+        # The session sends the accept header and json= sets Content-Type
+        response = self._http.post(url, json=payload)
         response.raise_for_status()
 
         meeting_data = response.json()
@@ -433,6 +474,29 @@ class App:
         logger.info(f"Meeting created with ID: {meeting_id}")
         return meeting_data
 
+    async def create_meeting_async(self, meeting_id: str, start_time=None, end_time=None):
+        """Create a meeting without blocking the event loop.
+
+        The request runs in a worker thread, so several meetings can be
+        created concurrently while the app keeps handling messages.
+
+        Args:
+            meeting_id: Unique identifier for the meeting
+            start_time: Start time of the meeting as datetime object (defaults to current time)
+            end_time: End time of the meeting as datetime object (defaults to 1 hour from start)
+        """
+        return await asyncio.to_thread(self.create_meeting, meeting_id, start_time, end_time)
+
+    @staticmethod
+    def _format_utc(value: datetime.datetime) -> str:
+        """Format a datetime as an ISO 8601 UTC timestamp ending in "Z".
+
+        Naive datetimes are taken to be in UTC already.
+        """
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return value.isoformat() + "Z"
+
     def on_ui_type(self, ui_type: str) -> Callable[[Callable[[CustomUIElementMessage], Any]], Callable[[CustomUIElementMessage], Any]]:
         """Register a handler for a specific UI element type.
 
@@ -441,7 +505,7 @@ class App:
         Returns:
             Decorator function
         """
-        logger.debug(f"Creating handler for UI element type: {ui_type}")
+        logger.debug("Creating handler for UI element type: %s", ui_type)
         return self.on(ui_type)
 
     def on_connection_rejected(
@@ -483,22 +547,6 @@ class App:
             self.on(MCQ_QUESTION_EVENT)(func) if func else self.on(MCQ_QUESTION_EVENT)
         )
 
-    def on_places_autocomplete_response(self, func=None):
-        """Register a handler for places autocomplete response events.
-
-        Args:
-            func: Function that takes a CustomUIElementMessage with places autocomplete data and processes it.
-                  If None, returns a decorator.
-
-        Returns:
-            Either the registered function or a decorator function
-        """
-        return (
-            self.on(PLACES_AUTOCOMPLETE_EVENT)(func)
-            if func
-            else self.on(PLACES_AUTOCOMPLETE_EVENT)
-        )
-
     def on_upload_file_response(self, func=None):
         """Register a handler for file upload response events.
 
@@ -523,32 +571,6 @@ class App:
         """
         return self.on(TEXTINPUT_EVENT)(func) if func else self.on(TEXTINPUT_EVENT)
 
-    def on_consent_form_response(self, func=None):
-        """Register a handler for consent form response events.
-
-        Args:
-            func: Function that takes a CustomUIElementMessage with consent form data and processes it.
-                  If None, returns a decorator.
-
-        Returns:
-            Either the registered function or a decorator function
-        """
-        return (
-            self.on(CONSENT_FORM_EVENT)(func) if func else self.on(CONSENT_FORM_EVENT)
-        )
-
-    def on_calendly_response(self, func=None):
-        """Register a handler for Calendly scheduling response events.
-
-        Args:
-            func: Function that takes a CustomUIElementMessage with Calendly data and processes it.
-                  If None, returns a decorator.
-
-        Returns:
-            Either the registered function or a decorator function
-        """
-        return self.on(CALENDLY_EVENT)(func) if func else self.on(CALENDLY_EVENT)
-
     def on_ui_element_response(self, element_type: str = None):
         """Register a handler for UI element responses.
         
@@ -561,34 +583,25 @@ class App:
         def decorator(func):
             # If a specific element type is provided
             if (element_type):
-                # Create wrapper that checks the element type
+                # Create wrapper that checks the element type; the dispatcher
+                # checks the message type before calling it
                 async def wrapper(message: CustomUIElementResponse):
-                    if not isinstance(message, CustomUIElementResponse):
-                        logger.error(f"Expected CustomUIElementResponse, got {type(message).__name__}")
-                        return
-                        
                     try:
                         if message.content.type == element_type:
-                            return await func(message)
+                            # func may be a plain function as well
+                            result = func(message)
+                            if asyncio.iscoroutine(result):
+                                result = await result
+                            return result
                     except Exception as e:
                         logger.error(f"Error handling {element_type} response: {str(e)}")
                 
                 # Register element-specific handler
-                logger.debug(f"Registering handler for UI element type: {element_type}")
-                self.event_dispatcher.register(event_type, wrapper)
+                logger.debug("Registering handler for UI element type: %s", element_type)
+                self.event_dispatcher.register(event_type, wrapper, CustomUIElementResponse)
             else:
                 # Register general handler for all UI responses
-                def type_safe_wrapper(message: CustomUIElementResponse):
-                    if not isinstance(message, CustomUIElementResponse):
-                        logger.error(f"Expected CustomUIElementResponse, got {type(message).__name__}")
-                        return
-                    
-                    try:
-                        return func(message)
-                    except Exception as e:
-                        logger.error(f"Error handling custom UI response: {str(e)}")
-                
-                self.event_dispatcher.register(event_type, type_safe_wrapper)
+                self.event_dispatcher.register(event_type, func, CustomUIElementResponse)
                 
             return func
             
@@ -601,45 +614,83 @@ class App:
         def mcq_decorator(func):
             async def mcq_wrapper(message: CustomUIElementResponse):
                 try:
-                    if isinstance(message, CustomUIElementResponse) and message.content.type == "mcq_question":
-                        data = message.content.data
-                        # Access fields safely
-                        selected_option = getattr(data, "selectedOption", None)
-                        if selected_option is None and isinstance(data, dict):
-                            selected_option = data.get("selectedOption")
-                            
-                        selected_index = getattr(data, "selectedIndex", None)
-                        if selected_index is None and isinstance(data, dict):
-                            selected_index = data.get("selectedIndex")
-                            
-                        # Pass the processed message to the handler
-                        return await func(message)
-                except Exception as e:
-                    logger.error(f"Error handling MCQ question: {str(e)}")
-                    import traceback
-                    logger.error(traceback.format_exc())
+                    # message.content.data is always an MCQQuestionResponseData here
+                    if message.content.type == "mcq_question":
+                        # func may be a plain function as well
+                        result = func(message)
+                        if asyncio.iscoroutine(result):
+                            result = await result
+                        return result
+                except Exception:
+                    logger.exception("Error handling MCQ question")
                     
-            self.event_dispatcher.register("mcq_question", mcq_wrapper)
+            self.event_dispatcher.register("mcq_question", mcq_wrapper, CustomUIElementResponse)
             return func
         
         return mcq_decorator
-        
-    def on_places_autocomplete_response(self):
-        """Register a handler specifically for places autocomplete responses."""
-        return self.on_ui_element_response("places_autocomplete")
-    
-    def on_file_upload_response(self):
-        """Register a handler specifically for file upload responses."""
-        return self.on_ui_element_response("upload_file")
-    
-    def on_text_input_response(self):
-        """Register a handler specifically for text input responses."""
-        return self.on_ui_element_response("textinput")
+
+
+# UI element types with an on_<name> shorthand that registers a handler for
+# their responses through App.on_ui_element_response
+UI_RESPONSE_SHORTHANDS = MappingProxyType({
+    "places_autocomplete_response": PLACES_AUTOCOMPLETE_EVENT,
+    "file_upload_response": UPLOAD_FILE_EVENT,
+    "text_input_response": TEXTINPUT_EVENT,
+    "consent_form_response": CONSENT_FORM_EVENT,
+    "calendly_response": CALENDLY_EVENT,
+})
+
+
+def _make_on_handler(alias: str, event_type: str):
+    """
+    Build the on_<alias> registration method for an event alias.
     
-    def on_consent_form_response(self):
-        """Register a handler specifically for consent form responses."""
-        return self.on_ui_element_response("consent_form")
+    Args:
+        alias: The event alias, as listed in EVENT_ALIASES.
+        event_type: The event type the alias resolves to.
+        
+    Returns:
+        A method that registers handlers for the event type, usable both as
+        @app.on_<alias>() and as app.on_<alias>(func).
+    """
+    name = f"on_{alias}"
+
+    def handler_method(self, func=None):
+        return self._on_event(event_type, func, name)
+
+    handler_method.__name__ = name
+    handler_method.__qualname__ = f"App.{name}"
+    handler_method.__doc__ = f"Register a handler for {event_type} events."
+    return handler_method
+
+
+def _make_ui_response_handler(name: str, element_type: str):
+    """
+    Build the on_<name> registration method for a UI element type.
     
-    def on_calendly_response(self):
-        """Register a handler specifically for Calendly scheduling responses."""
-        return self.on_ui_element_response("calendly")
+    Args:
+        name: The shorthand name, as listed in UI_RESPONSE_SHORTHANDS.
+        element_type: The UI element type whose responses are handled.
+        
+    Returns:
+        A method returning a decorator that registers handlers for responses
+        to UI elements of that type.
+    """
+    def handler_method(self):
+        return self.on_ui_element_response(element_type)
+
+    handler_method.__name__ = f"on_{name}"
+    handler_method.__qualname__ = f"App.on_{name}"
+    handler_method.__doc__ = f"Register a handler specifically for {element_type} responses."
+    return handler_method
+
+
+for _name, _element_type in UI_RESPONSE_SHORTHANDS.items():
+    setattr(App, f"on_{_name}", _make_ui_response_handler(_name, _element_type))
+del _name, _element_type
+
+# Create the on_<alias> shorthands once, leaving explicitly defined methods alone
+for _alias, _event_type in EVENT_ALIASES.items():
+    if not hasattr(App, f"on_{_alias}"):
+        setattr(App, f"on_{_alias}", _make_on_handler(_alias, _event_type))
+del _alias, _event_type
@@ -15,13 +15,15 @@ from typing import Optional, Dict, Any, Union
 logger = logging.getLogger(__name__)
 
 
-def authenticate_api_key(api_key: str) -> bool:
+def authenticate_api_key(api_key: str, session: Optional[requests.Session] = None) -> bool:
     """Authenticate an API key.
 
     This implementation validates the API key against a remote server.
 
     Args:
         api_key: The API key to authenticate
+        session: Optional requests session to send the request with, so its
+                 pooled connection to the backend can be reused
 
     Returns:
         True if authentication succeeded, False otherwise
@@ -37,7 +39,7 @@ def authenticate_api_key(api_key: str) -> bool:
     data = {"api_key": api_key}
 
     try:
-        response = requests.post(url, headers=headers, json=data)
+        response = (session or requests).post(url, headers=headers, json=data)
         response.raise_for_status()
         result = response.json()
         return result.get("is_valid", False)
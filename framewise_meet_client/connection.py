@@ -1,11 +1,11 @@
 import asyncio
-import json
 import logging
 import websockets
 import ssl
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
 from .errors import ConnectionError, AuthenticationError
+from .serialization import dumps_bytes, loads
 
 logger = logging.getLogger(__name__)
 
@@ -88,9 +88,12 @@ class WebSocketConnection:
             if protocol == "wss":
                 ssl_context = ssl.create_default_context()
             
+            # Meeting traffic is mostly small JSON messages, for which
+            # per-message compression costs more CPU than it saves bandwidth
             self.websocket = await websockets.connect(
-                url, 
-                ssl=ssl_context
+                url,
+                ssl=ssl_context,
+                compression=None,
             )
             
             self.connected = True
@@ -101,9 +104,9 @@ class WebSocketConnection:
                 try:
                     # Wait for auth confirmation message with timeout
                     auth_message = await asyncio.wait_for(
-                        self.websocket.recv(), timeout=5.0
+                        self.websocket.recv(decode=False), timeout=5.0
                     )
-                    auth_data = json.loads(auth_message)
+                    auth_data = loads(auth_message)
 
                     if auth_data.get("type") == "auth_result" and not auth_data.get(
                         "success", False
@@ -161,7 +164,29 @@ class WebSocketConnection:
             raise ConnectionError("Not connected to server")
 
         try:
-            await self.websocket.send(json.dumps(message))
+            # Send the UTF-8 JSON as a text frame, without a round trip through str
+            await self.websocket.send(dumps_bytes(message), text=True)
+        except Exception as e:
+            logger.error(f"Failed to send message: {str(e)}")
+            raise ConnectionError(f"Failed to send message: {str(e)}")
+
+    async def send_text(self, text: Union[str, bytes]) -> None:
+        """
+        Send an already serialized JSON message to the server.
+        
+        Args:
+            text: The JSON of the message, as a str or as UTF-8 bytes. Both
+                  are sent as a text frame.
+                   
+        Raises:
+            ConnectionError: If the connection is not established or if
+                           there's an error during message transmission.
+        """
+        if not self.connected or not self.websocket:
+            raise ConnectionError("Not connected to server")
+
+        try:
+            await self.websocket.send(text, text=True)
         except Exception as e:
             logger.error(f"Failed to send message: {str(e)}")
             raise ConnectionError(f"Failed to send message: {str(e)}")
@@ -188,7 +213,7 @@ class WebSocketConnection:
         Receive and parse a JSON message from the server.
         
         This method:
-        1. Receives a raw string message from the WebSocket connection
+        1. Receives a raw message from the WebSocket connection as UTF-8 bytes
         2. Parses it as JSON into a Python dictionary
         3. Returns the parsed message
         
@@ -203,13 +228,20 @@ class WebSocketConnection:
         Note:
             If the connection is closed by the server, this method will set
             the connected flag to False before raising the exception.
+            
+            The websockets library buffers incoming frames in the background,
+            and recv() returns a buffered message without suspending, so a
+            burst of messages is drained without a trip through the event
+            loop per message.
         """
         if not self.connected or not self.websocket:
             raise ConnectionError("Not connected to server")
 
         try:
-            message = await self.websocket.recv()
-            return json.loads(message)
+            # The JSON parser reads UTF-8 bytes directly, so skip decoding
+            # each frame into a str first
+            message = await self.websocket.recv(decode=False)
+            return loads(message)
         except websockets.exceptions.ConnectionClosed:
             self.connected = False
             logger.warning("Connection closed")
@@ -83,5 +83,5 @@ def extract_message_content_safely(message: Any, field_name: str, default_value:
             if isinstance(content, dict) and field_name in content:
                 return content[field_name]
     except Exception as e:
-        logger.debug(f"Error extracting {field_name} from message: {e}")
+        logger.debug("Error extracting %s from message: %s", field_name, e)
     return default_value
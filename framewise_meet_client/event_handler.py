@@ -18,7 +18,8 @@ Usage:
 """
 
 import asyncio
-from typing import Any, Callable, Dict, List, Union
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 import logging
 from .models.inbound import BaseMessage
 from .exceptions import InvalidMessageTypeError
@@ -43,17 +44,37 @@ class EventDispatcher:
     This class is typically used internally by the App class, which provides a
     more user-friendly decorator-based interface for event registration.
     """
+
+    # Errors logged with a traceback per handler before further ones go to debug
+    MAX_LOGGED_FAILURES = 100
     
     def __init__(self):
         """
         Initialize the event dispatcher with an empty handler registry.
         
         The handler registry is a dictionary mapping event types (strings) to
-        lists of handler functions.
+        lists of (handler, message_class) pairs. Dispatching reads from a
+        snapshot of it, with each list frozen into a tuple of
+        (handler, message_class, is_coro) entries, which is rebuilt whenever
+        a handler is registered.
         """
-        self._handlers: Dict[str, List[Callable[[BaseMessage], Any]]] = {}
+        self._handlers: Dict[
+            str, List[Tuple[Callable[[BaseMessage], Any], Optional[Type[BaseMessage]]]]
+        ] = {}
+        # Keyed by the event type string itself: event types arrive as strings
+        # whose hashes are cached, so one dict lookup is all dispatch needs
+        self._dispatch_table: Dict[
+            str, Tuple[Tuple[Callable[[BaseMessage], Any], Optional[Type[BaseMessage]], bool], ...]
+        ] = {}
+        # Number of errors raised by each handler, keyed by handler id
+        self._failures: Dict[int, int] = {}
     
-    def register(self, event_type: str, handler: Callable[[BaseMessage], Any]) -> None:
+    def register(
+        self,
+        event_type: str,
+        handler: Callable[[BaseMessage], Any],
+        message_class: Optional[Type[BaseMessage]] = None,
+    ) -> None:
         """
         Register a handler function for a specific event type.
         
@@ -66,12 +87,20 @@ class EventDispatcher:
             handler: The handler function to call when events of this type are dispatched.
                     The handler should accept a single argument of type BaseMessage or
                     a subclass appropriate for the event type.
+            message_class: Optional message class the handler expects. Messages of
+                    any other type are logged and not passed to the handler.
         """
         if event_type not in self._handlers:
             self._handlers[event_type] = []
         
-        self._handlers[event_type].append(handler)
-        logger.debug(f"Registered handler for event type {event_type}")
+        self._handlers[event_type].append((handler, message_class))
+        # Work out once whether each handler is a coroutine function, rather
+        # than inspecting it on every dispatch
+        self._dispatch_table[event_type] = tuple(
+            (registered, cls, inspect.iscoroutinefunction(registered))
+            for registered, cls in self._handlers[event_type]
+        )
+        logger.debug("Registered handler for event type %s", event_type)
     
     # Alias for backward compatibility
     register_handler = register
@@ -99,29 +128,59 @@ class EventDispatcher:
             error in one handler won't prevent other handlers from executing.
         """
         # We need to check if data is a subclass of BaseMessage, not strictly BaseMessage
-        from .models.inbound import BaseMessage
-        if not isinstance(data, BaseMessage) and not isinstance(data, dict):
+        if not isinstance(data, (BaseMessage, dict)):
             logger.error(f"Cannot dispatch event: expected a BaseMessage subclass or dict, got {type(data).__name__}")
             return
             
-        handlers = self._handlers.get(event_type, [])
+        handlers = self._dispatch_table.get(event_type, ())
         if not handlers:
-            logger.debug(f"No handlers registered for event type {event_type}")
+            logger.debug("No handlers registered for event type %s", event_type)
             return
             
-        logger.debug(f"Dispatching event {event_type} to {len(handlers)} handlers")
+        logger.debug("Dispatching event %s to %d handlers", event_type, len(handlers))
         
-        for handler in handlers:
+        for handler, message_class, is_coro in handlers:
+            # Messages are usually exactly the expected class, so compare the
+            # class first and only fall back to isinstance for subclasses
+            if (
+                message_class is not None
+                and data.__class__ is not message_class
+                and not isinstance(data, message_class)
+            ):
+                logger.error(f"Expected {message_class.__name__}, got {type(data).__name__}")
+                continue
+
             try:
                 result = handler(data)
-                if asyncio.iscoroutine(result):
-                    try:
-                        await result
-                    except Exception as e:
-                        logger.error(f"Error in async handler for event {event_type}: {e}")
-                        logger.error(traceback.format_exc())
-            
-            except Exception as e:
-                logger.error(f"Error in handler for event {event_type}: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
+                # Sync handlers may still return an awaitable, e.g. a partial
+                # wrapping a coroutine function
+                if is_coro or (result is not None and asyncio.iscoroutine(result)):
+                    await result
+            except Exception:
+                self._log_handler_error(event_type, handler)
+
+    def _log_handler_error(self, event_type: str, handler: Callable[[BaseMessage], Any]) -> None:
+        """
+        Log the exception being handled for a failed handler call.
+        
+        The first MAX_LOGGED_FAILURES errors of each handler are logged with
+        their traceback at error level. Later ones are logged at debug level,
+        so a handler that fails on every message doesn't flood the log.
+        
+        Args:
+            event_type: The event type that was being dispatched.
+            handler: The handler that raised the exception.
+        """
+        failures = self._failures.get(id(handler), 0) + 1
+        self._failures[id(handler)] = failures
+
+        if failures > self.MAX_LOGGED_FAILURES:
+            logger.debug("Error in handler for event %s", event_type, exc_info=True)
+            return
+
+        logger.exception("Error in handler for event %s", event_type)
+        if failures == self.MAX_LOGGED_FAILURES:
+            logger.error(
+                "Handler %s for event %s failed %d times, logging further errors at debug level",
+                getattr(handler, "__name__", handler), event_type, failures,
+            )
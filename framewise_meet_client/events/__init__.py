@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 # Update imports to use inbound module
 from ..models.inbound import (
     JoinMessage,
@@ -30,8 +32,9 @@ TEXTINPUT_EVENT = "textinput"
 CONSENT_FORM_EVENT = "consent_form"
 CALENDLY_EVENT = "calendly"
 
-# Mapping of event types to handler classes
-EVENT_HANDLERS = {
+# Mapping of event types to handler classes, read-only because it is shared
+# by every App in the process
+EVENT_HANDLERS = MappingProxyType({
     TRANSCRIPT_EVENT: TranscriptHandler,
     JOIN_EVENT: JoinHandler,
     EXIT_EVENT: ExitHandler,
@@ -45,7 +48,7 @@ EVENT_HANDLERS = {
     TEXTINPUT_EVENT: CustomUIHandler,
     CONSENT_FORM_EVENT: CustomUIHandler,
     CALENDLY_EVENT: CustomUIHandler,
-}
+})
 
 __all__ = [
     "EventHandler",
@@ -86,5 +86,5 @@ def register_event_handler(app, event_type: str, handler_func: Callable):
 
     handler_class = EVENT_HANDLERS[event_type]
     handler = handler_class(app.event_dispatcher)
-    logger.debug(f"Using {handler_class.__name__} for event type '{event_type}'")
+    logger.debug("Using %s for event type '%s'", handler_class.__name__, event_type)
     return handler.register(handler_func)
@@ -35,7 +35,8 @@ class CustomUIHandler(EventHandler[CustomUIElementResponse]):
     event_type = "custom_ui_element_response"
     message_class = CustomUIElementResponse
 
-    def get_element_type(self, data: Dict[str, Any]) -> Optional[str]:
+    @staticmethod
+    def get_element_type(data: Dict[str, Any]) -> Optional[str]:
         """
         Extract the UI element subtype from the raw message data.
 
@@ -45,9 +46,6 @@ class CustomUIHandler(EventHandler[CustomUIElementResponse]):
         Returns:
             The subtype string (e.g., 'mcq_question') or None if not found.
         """
-        try:
-            return extract_message_content_safely(data, "type")
-        except Exception as e:
-            logger.error(f"Error extracting UI element type: {e}")
-            return None
+        # Extraction errors are already caught and logged by the helper
+        return extract_message_content_safely(data, "type")
 
@@ -44,7 +44,7 @@ class EventDispatcher:
             self._handlers[event_type] = []
         
         self._handlers[event_type].append(handler)
-        logger.debug(f"Registered handler for event type {event_type}")
+        logger.debug("Registered handler for event type %s", event_type)
     
     async def dispatch(self, event_type: str, data: BaseMessage) -> None:
         """Dispatch an event to all registered handlers.
@@ -58,10 +58,10 @@ class EventDispatcher:
             
         handlers = self._handlers.get(event_type, [])
         if not handlers:
-            logger.debug(f"No handlers registered for event type {event_type}")
+            logger.debug("No handlers registered for event type %s", event_type)
             return
             
-        logger.debug(f"Dispatching event {event_type} to {len(handlers)} handlers")
+        logger.debug("Dispatching event %s to %d handlers", event_type, len(handlers))
         
         for handler in handlers:
             try:
@@ -1,9 +1,9 @@
 import asyncio
 import logging
-import json
 import uuid
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Any, Optional, TypeVar, Type, Union
+from typing import Awaitable, Deque, List, Dict, Any, Optional, Tuple, TypeVar, Type, Union
 from pydantic import BaseModel
 
 from .models.outbound import (
@@ -39,6 +39,7 @@ from .models.inbound import (
 )
 
 from .errors import ConnectionError
+from .serialization import dumps_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,87 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+class _Queued:
+    """
+    Awaitable that completes immediately.
+
+    send_generated_text queues its chunk without waiting for it to be sent.
+    It returns this so callers written for the former coroutine version,
+    which `await` it, keep working.
+    """
+
+    __slots__ = ()
+
+    def __await__(self):
+        return
+        yield
+
+
+_QUEUED = _Queued()
+
+
+def _generated_text_template(is_generation_end: bool) -> Tuple[bytes, bytes]:
+    """
+    Split the JSON of a generated text message around its text.
+    
+    Args:
+        is_generation_end: Value of the message's is_generation_end flag.
+        
+    Returns:
+        The UTF-8 JSON before and after the text, so that a message is
+        prefix + dumps_bytes(text) + suffix.
+    """
+    placeholder = "__text__"
+    content = GeneratedTextContent(text=placeholder, is_generation_end=is_generation_end)
+    message = dumps_bytes(GeneratedTextMessage(content=content).model_dump())
+    prefix, suffix = message.split(dumps_bytes(placeholder))
+    return prefix, suffix
+
+
+# JSON around the text of generated text messages, by is_generation_end
+_GENERATED_TEXT_TEMPLATES = {
+    flag: _generated_text_template(flag) for flag in (False, True)
+}
+
+# Element and data models of the UI elements with a dedicated send method,
+# by element type
+_UI_ELEMENT_MODELS = {
+    "mcq_question": (MCQQuestionElement, MCQQuestionData),
+    "notification_element": (NotificationElement, NotificationData),
+    "places_autocomplete": (PlacesAutocompleteElement, PlacesAutocompleteData),
+    "upload_file": (UploadFileElement, UploadFileData),
+    "textinput": (TextInputElement, TextInputData),
+    "consent_form": (ConsentFormElement, ConsentFormData),
+    "calendly": (CalendlyElement, CalendlyData),
+}
+
+
+def _ui_element_template(element_class: Type[BaseModel]) -> Tuple[bytes, bytes]:
+    """
+    Split the JSON of a custom UI element message around its data.
+    
+    Args:
+        element_class: The element model, whose type field has a default.
+        
+    Returns:
+        The UTF-8 JSON before and after the element data, so that a message
+        is prefix + dumps_bytes(data) + suffix.
+    """
+    message = {
+        "type": CustomUIElementMessage.model_fields["type"].default,
+        "content": {"type": element_class.model_fields["type"].default, "data": None},
+    }
+    prefix, suffix = dumps_bytes(message).split(b"null")
+    return prefix, suffix
+
+
+# JSON around the data of custom UI element messages, by element type
+_UI_ELEMENT_TEMPLATES = {
+    element_type: _ui_element_template(element_class)
+    for element_type, (element_class, _) in _UI_ELEMENT_MODELS.items()
+}
+
+
 class MessageSender:
     """
     Manages sending various types of messages to the Framewise backend server.
@@ -66,6 +148,23 @@ class MessageSender:
     directly for convenience.
     """
 
+    # Seconds after the first buffered generated text chunk before the buffer is sent
+    GENERATED_TEXT_FLUSH_DELAY = 0.01
+
+    # Send methods that App exposes directly once it has joined a meeting
+    PROXIED_METHODS = (
+        "send_generated_text",
+        "send_custom_ui_element",
+        "send_mcq_question",
+        "send_notification",
+        "send_places_autocomplete",
+        "send_upload_file",
+        "send_text_input",
+        "send_consent_form",
+        "send_calendly",
+        "send_error",
+    )
+
     def __init__(self, connection):
         """
         Initialize the message sender with a WebSocket connection.
@@ -75,6 +174,12 @@ class MessageSender:
                        to the Framewise backend.
         """
         self.connection = connection
+        self._pending_text: List[str] = []
+        # Messages waiting to be sent, as models or serialized JSON text, and
+        # the task sending them while there are any
+        self._outbox: Deque[Union[BaseModel, bytes]] = deque()
+        self._writer: Optional[asyncio.Task] = None
+        self._pending_flush: Optional[asyncio.TimerHandle] = None
 
     async def _send_model(self, model: BaseModel) -> None:
         """
@@ -95,8 +200,27 @@ class MessageSender:
             # Convert model to dict and send
             message_dict = model.model_dump()
             await self.connection.send(message_dict)
-            logger.debug(message_dict)
-            logger.debug(f"Message sent: {message_dict.get('type', 'unknown')}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(message_dict)
+                logger.debug("Message sent: %s", message_dict.get('type', 'unknown'))
+        except Exception as e:
+            logger.error(f"Error sending message: {str(e)}")
+
+    async def _send_text(self, text: bytes) -> None:
+        """
+        Send an already serialized JSON message to the server.
+        
+        Args:
+            text: The UTF-8 JSON of the message.
+        """
+        if not self.connection.connected:
+            logger.warning("Cannot send message: Connection is not established")
+            return
+
+        try:
+            await self.connection.send_text(text)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Message sent: %.100s", text.decode())
         except Exception as e:
             logger.error(f"Error sending message: {str(e)}")
 
@@ -118,10 +242,11 @@ class MessageSender:
             raise ConnectionError("Not connected to server")
 
         try:
-            # Add detailed message format logging
-            logger.debug(f"Sending message format: {json.dumps(message, indent=2)}")
-            await self.connection.send_json(message)
-            logger.debug(f"Sent message: {json.dumps(message)[:100]}...")
+            # Serialize once and log the same text that is sent
+            text = dumps_bytes(message)
+            await self.connection.send_text(text)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent message: %.100s...", text.decode())
         except Exception as e:
             logger.error(f"Error sending message: {str(e)}")
             raise ConnectionError(f"Failed to send message: {str(e)}")
@@ -145,38 +270,108 @@ class MessageSender:
             response = CustomUIElementResponse.model_validate(response_data)
             
             # Log the response type for debugging
-            logger.debug(f"Received UI response for element type: {response.content.type}")
-            
-            # Return the properly typed data based on the element type
-            element_type = response.content.type
-            data = response.content.data
+            logger.debug("Received UI response for element type: %s", response.content.type)
             
-            if element_type == "mcq_question":
-                return MCQQuestionResponseData(**data)
-            elif element_type == "places_autocomplete":
-                return PlacesAutocompleteResponseData(**data)
-            elif element_type == "upload_file":
-                return UploadFileResponseData(**data)
-            elif element_type == "textinput":
-                return TextInputResponseData(**data)
-            elif element_type == "consent_form":
-                return ConsentFormResponseData(**data)
-            elif element_type == "calendly":
-                return CalendlyResponseData(**data)
-                
-            # If we don't recognize the type, return the raw data
-            return data
+            # The data has already been parsed into the model of its element
+            # type, or kept as a dictionary for unknown types
+            return response.content.data
             
         except Exception as e:
             logger.error(f"Error processing UI element response: {str(e)}")
             return response_data
 
-    async def send_generated_text(
+    def _queue_generated_text(self, text: str, is_generation_end: bool) -> None:
+        """
+        Buffer a chunk of generated text until it can be sent.
+        
+        Chunks are sent together as soon as the generation ends, or
+        GENERATED_TEXT_FLUSH_DELAY seconds after the first buffered chunk,
+        whichever comes first. Later chunks do not postpone the flush, so a
+        steady stream is still sent at least that often. Must be called on
+        the event loop that sends the messages.
+        
+        Args:
+            text: The text chunk to buffer.
+            is_generation_end: Whether this chunk ends the generation.
+        """
+        self._pending_text.append(text)
+        if is_generation_end:
+            self._flush_generated_text(is_generation_end=True)
+        elif self._pending_flush is None:
+            self._pending_flush = asyncio.get_running_loop().call_later(
+                self.GENERATED_TEXT_FLUSH_DELAY, self._flush_generated_text
+            )
+
+    def _flush_generated_text(self, is_generation_end: bool = False) -> None:
+        """
+        Send all buffered generated text chunks as a single message.
+        
+        The client appends consecutive chunks of a generation, so sending
+        their concatenation is equivalent to sending them one by one.
+        
+        Args:
+            is_generation_end: Whether the combined message ends the generation.
+        """
+        if self._pending_flush is not None:
+            self._pending_flush.cancel()
+            self._pending_flush = None
+
+        if not self._pending_text:
+            return
+
+        # Only the text varies, so it is serialized into a prebuilt template
+        # rather than going through a GeneratedTextMessage model, joined in
+        # one step to avoid an intermediate copy. The frame stays UTF-8
+        # bytes, which websockets sends without encoding it again
+        prefix, suffix = _GENERATED_TEXT_TEMPLATES[is_generation_end]
+        text = b"".join((prefix, dumps_bytes("".join(self._pending_text)), suffix))
+        self._pending_text = []
+        self._enqueue(text)
+
+    def _enqueue(self, message: Union[BaseModel, bytes]) -> None:
+        """
+        Queue a message to be sent after those already queued.
+        
+        A single writer task sends queued messages back to back and exits
+        once the queue is empty, so a burst of messages shares one task
+        instead of scheduling a task per message. Must be called on the
+        event loop that sends the messages.
+        
+        Args:
+            message: A Pydantic model, or the UTF-8 JSON of a message.
+        """
+        self._outbox.append(message)
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._drain_outbox())
+
+    async def _drain_outbox(self) -> None:
+        """Send queued messages in order until the queue is empty."""
+        try:
+            while self._outbox:
+                message = self._outbox.popleft()
+                if isinstance(message, bytes):
+                    await self._send_text(message)
+                else:
+                    await self._send_model(message)
+        finally:
+            self._writer = None
+
+    def _send_after_generated_text(self, message: Union[BaseModel, bytes]) -> None:
+        """
+        Queue a message after sending any buffered generated text.
+        
+        Args:
+            message: A Pydantic model, or the UTF-8 JSON of a message.
+        """
+        self._flush_generated_text()
+        self._enqueue(message)
+
+    def send_generated_text(
         self,
         text: str,
         is_generation_end: bool = False,
         loop: Optional[asyncio.AbstractEventLoop] = None,
-    ) -> None:
+    ) -> Awaitable[None]:
         """
         Send generated text to the client through the Framewise backend.
         
@@ -185,6 +380,10 @@ class MessageSender:
         with is_generation_end=False, followed by a final message with
         is_generation_end=True to indicate the end of the generation.
         
+        Chunks sent in quick succession are combined into a single WebSocket
+        message, which is sent when the generation ends or at most
+        GENERATED_TEXT_FLUSH_DELAY seconds after the first of them.
+        
         Args:
             text: The text content to send.
             is_generation_end: Boolean flag indicating whether this is the last
@@ -193,6 +392,10 @@ class MessageSender:
             loop: Optional event loop to use for sending the message. If None,
                  uses the current event loop.
         
+        Returns:
+            An awaitable that completes immediately. The chunk is queued
+            either way, so awaiting it is optional.
+        
         Example:
             ```python
             # For streaming text generation:
@@ -204,15 +407,12 @@ class MessageSender:
             sender.send_generated_text("Hello, how are you today?", is_generation_end=True)
             ```
         """
-        # Create the model with content
-        content = GeneratedTextContent(text=text, is_generation_end=is_generation_end)
-        message = GeneratedTextMessage(content=content)
-
-        # Send the message
+        # Buffer the chunk on the loop that sends it
         if loop:
-            asyncio.run_coroutine_threadsafe(self._send_model(message), loop)
+            loop.call_soon_threadsafe(self._queue_generated_text, text, is_generation_end)
         else:
-            await self._send_model(message)
+            self._queue_generated_text(text, is_generation_end)
+        return _QUEUED
 
     def send_custom_ui_element(
         self,
@@ -236,11 +436,44 @@ class MessageSender:
         # Create the message with the element
         message = CustomUIElementMessage(content=ui_element)
 
-        # Send the message
+        # Send the message, after any buffered generated text
+        if loop:
+            loop.call_soon_threadsafe(self._send_after_generated_text, message)
+        else:
+            self._send_after_generated_text(message)
+
+    def _send_ui_element(
+        self,
+        element_type: str,
+        loop: Optional[asyncio.AbstractEventLoop],
+        **fields: Any,
+    ) -> None:
+        """
+        Build a UI element of the given type from its data fields and send it.
+        
+        Only the data model is built and serialized. The element and message
+        around it are the same for every element of a type, so their JSON
+        comes from a prebuilt template.
+        
+        Args:
+            element_type: The element type, one of the keys of _UI_ELEMENT_MODELS.
+            loop: Optional event loop to use for sending the message.
+            **fields: Fields of the element's data model.
+        """
+        # The data is validated even though the fields come from typed
+        # parameters: that reports bad arguments to the caller, and
+        # model_construct, which loops over the fields in Python, is slower
+        # than pydantic-core validation for models this small
+        data_class = _UI_ELEMENT_MODELS[element_type][1]
+        data = data_class(**fields).model_dump()
+        prefix, suffix = _UI_ELEMENT_TEMPLATES[element_type]
+        text = b"".join((prefix, dumps_bytes(data), suffix))
+
+        # Send the message, after any buffered generated text
         if loop:
-            asyncio.run_coroutine_threadsafe(self._send_model(message), loop)
+            loop.call_soon_threadsafe(self._send_after_generated_text, text)
         else:
-            asyncio.create_task(self._send_model(message))
+            self._send_after_generated_text(text)
 
     def send_mcq_question(
         self,
@@ -273,19 +506,14 @@ class MessageSender:
             )
             ```
         """
-        # Create the model with properly typed data
-        mcq_data = MCQQuestionData(
+        self._send_ui_element(
+            "mcq_question",
+            loop,
             id=question_id,
             question=question,
             options=options,
-            image_path=image_path
+            image_path=image_path,
         )
-        
-        # Create the element model
-        mcq_element = MCQQuestionElement(type="mcq_question", data=mcq_data)
-        
-        # Send as custom UI element
-        self.send_custom_ui_element(mcq_element, loop)
 
     def send_notification(
         self,
@@ -322,22 +550,14 @@ class MessageSender:
             )
             ```
         """
-        # Create the model with properly typed data
-        notification_data = NotificationData(
+        self._send_ui_element(
+            "notification_element",
+            loop,
             id=notification_id,
             message=text,
-            level=level, 
-            duration=duration
-        )
-        
-        # Create the element model
-        notification_element = NotificationElement(
-            type="notification_element", 
-            data=notification_data
+            level=level,
+            duration=duration,
         )
-        
-        # Send as custom UI element
-        self.send_custom_ui_element(notification_element, loop)
 
     def send_places_autocomplete(
         self,
@@ -368,21 +588,13 @@ class MessageSender:
             )
             ```
         """
-        # Create the model with properly typed data
-        places_data = PlacesAutocompleteData(
+        self._send_ui_element(
+            "places_autocomplete",
+            loop,
             id=element_id,
             text=text,
-            placeholder=placeholder
-        )
-        
-        # Create the element model
-        places_element = PlacesAutocompleteElement(
-            type="places_autocomplete", 
-            data=places_data
+            placeholder=placeholder,
         )
-        
-        # Send as custom UI element
-        self.send_custom_ui_element(places_element, loop)
 
     def send_upload_file(
         self,
@@ -417,22 +629,14 @@ class MessageSender:
             )
             ```
         """
-        # Create the model with properly typed data
-        upload_data = UploadFileData(
+        self._send_ui_element(
+            "upload_file",
+            loop,
             id=element_id,
             text=text,
             allowed_types=allowed_types,
-            maxSizeMB=max_size_mb
-        )
-        
-        # Create the element model
-        upload_element = UploadFileElement(
-            type="upload_file", 
-            data=upload_data
+            maxSizeMB=max_size_mb,
         )
-        
-        # Send as custom UI element
-        self.send_custom_ui_element(upload_element, loop)
 
     def send_text_input(
         self,
@@ -475,22 +679,14 @@ class MessageSender:
             )
             ```
         """
-        # Create the model with properly typed data
-        text_input_data = TextInputData(
+        self._send_ui_element(
+            "textinput",
+            loop,
             id=element_id,
             prompt=prompt,
             placeholder=placeholder,
-            multiline=multiline
+            multiline=multiline,
         )
-        
-        # Create the element model
-        text_input_element = TextInputElement(
-            type="textinput", 
-            data=text_input_data
-        )
-        
-        # Send as custom UI element
-        self.send_custom_ui_element(text_input_element, loop)
 
     def send_consent_form(
         self,
@@ -526,23 +722,15 @@ class MessageSender:
             )
             ```
         """
-        # Create the model with properly typed data
-        consent_form_data = ConsentFormData(
+        self._send_ui_element(
+            "consent_form",
+            loop,
             id=element_id,
             text=text,
             checkboxLabel=checkbox_label,
             submitLabel=submit_label,
-            required=required
+            required=required,
         )
-        
-        # Create the element model
-        consent_form_element = ConsentFormElement(
-            type="consent_form", 
-            data=consent_form_data
-        )
-        
-        # Send as custom UI element
-        self.send_custom_ui_element(consent_form_element, loop)
 
     def send_calendly(
         self,
@@ -579,22 +767,14 @@ class MessageSender:
         Note:
             The Calendly URL must be from a valid Calendly account and properly formatted.
         """
-        # Create the model with properly typed data
-        calendly_data = CalendlyData(
+        self._send_ui_element(
+            "calendly",
+            loop,
             id=element_id,
             url=url,
             title=title,
-            subtitle=subtitle
+            subtitle=subtitle,
         )
-        
-        # Create the element model
-        calendly_element = CalendlyElement(
-            type="calendly", 
-            data=calendly_data
-        )
-        
-        # Send as custom UI element
-        self.send_custom_ui_element(calendly_element, loop)
 
     def send_error(
         self,
@@ -625,8 +805,8 @@ class MessageSender:
         # Create the error message
         message = ErrorResponse(error=error_message, error_code=error_code)
 
-        # Send the message
+        # Send the message, after any buffered generated text
         if loop:
-            asyncio.run_coroutine_threadsafe(self._send_model(message), loop)
+            loop.call_soon_threadsafe(self._send_after_generated_text, message)
         else:
-            asyncio.create_task(self._send_model(message))
+            self._send_after_generated_text(message)
@@ -28,8 +28,8 @@ Usage:
     ```
 """
 
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Any, ClassVar, Dict, List, Literal, Optional, Type, Union
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 class BaseMessage(BaseModel):
     """
@@ -323,6 +323,17 @@ class CalendlyResponseData(BaseModel):
     scheduledMeeting: Dict[str, Any] = Field(..., description="Meeting details")
 
 
+# Response data model of each known UI element type
+UI_RESPONSE_DATA_MODELS: Dict[str, Type[BaseModel]] = {
+    "mcq_question": MCQQuestionResponseData,
+    "places_autocomplete": PlacesAutocompleteResponseData,
+    "upload_file": UploadFileResponseData,
+    "textinput": TextInputResponseData,
+    "consent_form": ConsentFormResponseData,
+    "calendly": CalendlyResponseData,
+}
+
+
 class CustomUIContent(BaseModel):
     """Content for a custom UI element response."""
     
@@ -337,6 +348,17 @@ class CustomUIContent(BaseModel):
         Dict[str, Any]  # Fallback for unknown types
     ] = Field(..., description="Data for the UI element")
 
+    @field_validator("data", mode="wrap")
+    @classmethod
+    def _validate_data_for_type(cls, value: Any, handler, info: ValidationInfo) -> Any:
+        """Parse data with the model of its element type, keeping unknown types as dicts."""
+        data_model = UI_RESPONSE_DATA_MODELS.get(info.data.get("type"))
+        if data_model is not None:
+            return data_model.model_validate(value)
+        if isinstance(value, dict):
+            return value
+        return handler(value)
+
 
 class ConnectionRejectedEvent(BaseModel):
     """Connection rejected event data."""
@@ -366,12 +388,25 @@ class TranscriptMessage(BaseMessage):
     transcript: Optional[str] = None
     is_final: Optional[bool] = None
 
-    def model_post_init(self, *args, **kwargs):
+    # Validators don't run for defaults, so unlike model_post_init these cost
+    # nothing for messages in the current format
+    @field_validator("transcript")
+    @classmethod
+    def _apply_legacy_transcript(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Handle legacy transcript format."""
-        if self.transcript is not None:
-            self.content.text = self.transcript
-        if self.is_final is not None:
-            self.content.is_final = self.is_final
+        content = info.data.get("content")
+        if value is not None and content is not None:
+            content.text = value
+        return value
+
+    @field_validator("is_final")
+    @classmethod
+    def _apply_legacy_is_final(cls, value: Optional[bool], info: ValidationInfo) -> Optional[bool]:
+        """Handle legacy final transcript flag."""
+        content = info.data.get("content")
+        if value is not None and content is not None:
+            content.is_final = value
+        return value
 
 
 class InvokeMessage(BaseMessage):
@@ -26,8 +26,8 @@ Usage example:
     sender.send_custom_ui_element(subscription)
 """
 
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, Discriminator, Field, Tag
 
 
 class MCQOption(BaseModel):
@@ -166,9 +166,12 @@ class MCQContent(BaseModel):
 class CustomUIContent(BaseModel):
     """Content for custom UI response."""
 
-    elements: List[Union[CustomUIButtonElement, CustomUIInputElement]] = Field(
-        ..., description="UI elements"
-    )
+    elements: List[
+        Annotated[
+            Union[CustomUIButtonElement, CustomUIInputElement],
+            Field(discriminator="type"),
+        ]
+    ] = Field(..., description="UI elements")
 
 
 class GeneratedTextMessage(BaseModel):
@@ -391,6 +394,36 @@ class CalendlyElement(BaseModel):
     data: CalendlyData = Field(..., description="Calendly data")
 
 
+# Element types that have a model of their own
+_CUSTOM_UI_ELEMENT_TYPES = frozenset(
+    element_class.model_fields["type"].default
+    for element_class in (
+        MCQQuestionElement,
+        NotificationElement,
+        PlacesAutocompleteElement,
+        UploadFileElement,
+        TextInputElement,
+        ConsentFormElement,
+        CalendlyElement,
+    )
+)
+
+
+def _custom_ui_element_tag(value: Any) -> str:
+    """
+    Pick the model that validates a custom UI element from its type.
+
+    This lets pydantic validate the element against that one model instead
+    of trying each member of the union in turn. Elements of any other type
+    are validated as the generic CustomUIElement.
+    """
+    if isinstance(value, dict):
+        element_type = value.get("type")
+    else:
+        element_type = getattr(value, "type", None)
+    return element_type if element_type in _CUSTOM_UI_ELEMENT_TYPES else "custom"
+
+
 # Update the CustomUIElementMessage to include all the new element types
 class CustomUIElementMessage(BaseModel):
     """
@@ -402,15 +435,18 @@ class CustomUIElementMessage(BaseModel):
     """
 
     type: Literal["custom_ui_element"] = "custom_ui_element"
-    content: Union[
-        MCQQuestionElement,
-        NotificationElement,
-        PlacesAutocompleteElement,
-        UploadFileElement,
-        TextInputElement,
-        ConsentFormElement,
-        CalendlyElement,
-        CustomUIElement,
+    content: Annotated[
+        Union[
+            Annotated[MCQQuestionElement, Tag("mcq_question")],
+            Annotated[NotificationElement, Tag("notification_element")],
+            Annotated[PlacesAutocompleteElement, Tag("places_autocomplete")],
+            Annotated[UploadFileElement, Tag("upload_file")],
+            Annotated[TextInputElement, Tag("textinput")],
+            Annotated[ConsentFormElement, Tag("consent_form")],
+            Annotated[CalendlyElement, Tag("calendly")],
+            Annotated[CustomUIElement, Tag("custom")],
+        ],
+        Discriminator(_custom_ui_element_tag),
     ] = Field(..., description="Custom UI element")
 
 
@@ -8,12 +8,15 @@ conversion, event dispatching, reconnection logic, and graceful shutdown.
 Usage example:
     runner = AppRunner(connection, event_dispatcher)
     runner.run(app)
+
+    # or, from a coroutine on an existing event loop
+    await runner.run_async(app)
 """
 import asyncio
 import logging
 import signal
 from typing import Dict, Any, Type, Optional, Union
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from .errors import ConnectionError, AuthenticationError
 from .models.inbound import (
@@ -28,6 +31,24 @@ from .events import INVOKE_EVENT, CUSTOM_UI_EVENT, EXIT_EVENT
 
 logger = logging.getLogger(__name__)
 
+# Message type mapping
+MESSAGE_CLASSES = {
+    "on_join": JoinMessage,
+    "on_exit": ExitMessage,
+    "transcript": TranscriptMessage,
+    "custom_ui_element_response": CustomUIElementResponse,
+    "mcq_selection": MCQSelectionMessage,
+    "connection_rejected": ConnectionRejectedMessage,
+}
+
+# Validators for each message type, built once at import time. Every message
+# is fully validated: model_construct would leave nested content as plain
+# dicts and skip the parsing of UI response data by element type
+_MESSAGE_ADAPTERS = {
+    message_type: TypeAdapter(message_class)
+    for message_type, message_class in MESSAGE_CLASSES.items()
+}
+
 
 class AppRunner:
     """
@@ -45,15 +66,13 @@ class AppRunner:
     the event handling system.
     """
 
-    # Message type mapping
-    _message_classes = {
-        "on_join": JoinMessage,
-        "on_exit": ExitMessage,
-        "transcript": TranscriptMessage,
-        "custom_ui_element_response": CustomUIElementResponse,
-        "mcq_selection": MCQSelectionMessage,
-        "connection_rejected": ConnectionRejectedMessage,
-    }
+    _message_classes = MESSAGE_CLASSES
+
+    # Upper bound in seconds for the doubling delay between reconnection attempts
+    MAX_RECONNECT_DELAY = 60
+
+    # Received messages that may wait for handlers before receiving pauses
+    RECEIVE_QUEUE_SIZE = 64
 
     def __init__(
         self, connection, event_dispatcher, auto_reconnect=True, reconnect_delay=5
@@ -68,12 +87,17 @@ class AppRunner:
                              events to appropriate handlers.
             auto_reconnect: Boolean indicating whether to automatically reconnect
                           on disconnection (default: True).
-            reconnect_delay: Delay between reconnection attempts in seconds (default: 5).
+            reconnect_delay: Delay before the first reconnection attempt in seconds
+                           (default: 5). It doubles after each attempt that
+                           receives no messages, up to MAX_RECONNECT_DELAY or
+                           reconnect_delay itself, whichever is larger.
         """
         self.connection = connection
         self.event_dispatcher = event_dispatcher
         self.auto_reconnect = auto_reconnect
         self.reconnect_delay = reconnect_delay
+        # Delay before the next reconnection attempt
+        self._next_reconnect_delay = reconnect_delay
 
     def _convert_message(
         self, message_type: str, data: Dict[str, Any]
@@ -97,13 +121,15 @@ class AppRunner:
             ValidationError: If the message data fails validation against the model schema.
                            This is caught internally and logged as a warning.
         """
-        message_class = self._message_classes.get(message_type)
-        if not message_class:
+        # A dict lookup beats a match statement here: match compares the
+        # string against each case in turn rather than jumping to it
+        adapter = _MESSAGE_ADAPTERS.get(message_type)
+        if adapter is None:
             return None
 
         try:
-            logger.debug(f"Converting raw data to {message_class.__name__}")
-            return message_class.model_validate(data)
+            logger.debug("Converting raw data to %s", message_type)
+            return adapter.validate_python(data)
         except ValidationError as e:
             logger.warning(f"Validation error converting {message_type}: {e}")
             return None
@@ -111,13 +137,73 @@ class AppRunner:
             logger.warning(f"Unexpected error converting {message_type}: {e}")
             return None
 
+    async def _receive(self, queue: asyncio.Queue) -> None:
+        """
+        Receive messages from the WebSocket connection into a queue.
+        
+        This runs as a separate task alongside _listen, so the next messages
+        are received and parsed while handlers are still processing earlier
+        ones. The queue is bounded, which stops receiving while handlers fall
+        behind.
+        
+        Once receiving ends, None is queued to tell _listen to stop, or the
+        exception that ended it if that was not a connection error.
+        
+        Args:
+            queue: Queue that received messages are put into.
+            
+        Returns:
+            None
+        """
+        try:
+            while self.connection.connected:
+                data = await self.connection.receive()
+                self._next_reconnect_delay = self.reconnect_delay
+                await queue.put(data)
+        except ConnectionError as e:
+            logger.warning(f"Connection error: {str(e)}")
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(None)
+
     async def _listen(self) -> None:
         """
         Listen for incoming messages and dispatch to handlers.
         
         This method runs in a continuous loop while the connection is active,
-        receiving messages from the WebSocket connection, converting them to
-        appropriate types, and dispatching them to registered event handlers.
+        taking messages received by the _receive task, converting them to
+        appropriate types, and dispatching them to registered event handlers
+        one at a time, in the order they arrived.
+        
+        Returns:
+            None
+            
+        Raises:
+            Exception: Any error other than a ConnectionError raised while
+                      receiving, which may trigger reconnection.
+        """
+        queue = asyncio.Queue(self.RECEIVE_QUEUE_SIZE)
+        receiver = asyncio.create_task(self._receive(queue))
+        try:
+            while True:
+                data = await queue.get()
+                if data is None:
+                    break
+                if isinstance(data, Exception):
+                    raise data
+                if not await self._handle_message(data):
+                    break
+        finally:
+            receiver.cancel()
+            try:
+                await receiver
+            except asyncio.CancelledError:
+                pass
+
+    async def _handle_message(self, data: Dict[str, Any]) -> bool:
+        """
+        Convert a received message and dispatch it to handlers.
         
         Special handling is implemented for:
         - Connection rejection messages that may terminate the connection
@@ -125,93 +211,76 @@ class AppRunner:
         - Custom UI element responses that may require additional dispatching
           based on element type
         
-        Returns:
-            None
+        Args:
+            data: Raw message data dictionary received from WebSocket.
             
-        Raises:
-            ConnectionError: If there's an issue with the WebSocket connection.
-                           This is caught internally and may trigger reconnection.
+        Returns:
+            False if the connection was rejected and listening should stop,
+            True otherwise.
         """
-        try:
-            while self.connection.connected:
-                data = await self.connection.receive()
+        logger.debug("Received message: %s", data)
+        if "type" not in data:
+            logger.warning("Received message without type field")
+            return True
+
+        message_type = data["type"]
+
+        # Special handling for connection_rejected messages
+        if message_type == "connection_rejected":
+            rejected_message = ConnectionRejectedMessage.model_validate(data)
+            logger.warning(
+                f"Connection rejected: {rejected_message.content.reason}"
+            )
+            await self.event_dispatcher.dispatch(
+                "connection_rejected", rejected_message
+            )
+
+            # Stop the connection if rejected
+            self.app.running = False
+            return False
 
-                logger.info(data)
-                if "type" not in data:
-                    logger.warning("Received message without type field")
-                    continue
-
-                message_type = data["type"]
-
-                # Special handling for connection_rejected messages
-                if message_type == "connection_rejected":
-                    rejected_message = ConnectionRejectedMessage.model_validate(data)
-                    logger.warning(
-                        f"Connection rejected: {rejected_message.content.reason}"
-                    )
-                    await self.event_dispatcher.dispatch(
-                        "connection_rejected", rejected_message
-                    )
-
-                    # Stop the connection if rejected
-                    self.app.running = False
-                    break
+        # Always try to convert every message to its proper type
+        converted = self._convert_message(message_type, data)
 
-                # Always try to convert every message to its proper type
-                converted = None
-                message_class = self._message_classes.get(message_type)
-
-                if message_class is not None:
-                    try:
-                        converted = message_class.model_validate(data)
-                        logger.debug(
-                            f"Successfully converted to {message_class.__name__}"
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to convert {message_type} to {message_class.__name__}: {e}"
-                        )
-
-                # Dispatch the converted message if available, raw data otherwise
-                await self.event_dispatcher.dispatch(message_type, converted or data)
-
-                # Handle special events
-                if message_type == "transcript":
-                    # Check if this is a final transcript
-                    is_final = False
-                    if converted and isinstance(converted, TranscriptMessage):
-                        is_final = converted.content.is_final
-                    elif isinstance(data, dict):
-                        try:
-                            is_final = data.get("content", {}).get("is_final", False)
-                        except:
-                            pass
-
-                    if is_final:
-                        logger.debug(
-                            "Final transcript detected, triggering invoke event"
-                        )
-                        await self.event_dispatcher.dispatch(
-                            INVOKE_EVENT, converted or data
-                        )
-
-                # Handle UI subtypes and custom UI element responses
-                elif message_type == "custom_ui_element_response":
-                    ui_subtype = None
-                    if isinstance(data, dict):
-                        try:
-                            ui_subtype = data.get("content", {}).get("type")
-                        except:
-                            pass
-
-                    if ui_subtype:
-                        logger.debug(f"Dispatching to UI element type: {ui_subtype}")
-                        await self.event_dispatcher.dispatch(
-                            ui_subtype, converted or data
-                        )
+        # Dispatch the converted message if available, raw data otherwise
+        await self.event_dispatcher.dispatch(message_type, converted or data)
 
-        except ConnectionError as e:
-            logger.warning(f"Connection error: {str(e)}")
+        # Handle special events
+        if message_type == "transcript":
+            # Check if this is a final transcript
+            is_final = False
+            if converted and isinstance(converted, TranscriptMessage):
+                is_final = converted.content.is_final
+            else:
+                try:
+                    is_final = data["content"]["is_final"]
+                except (KeyError, TypeError):
+                    pass
+
+            if is_final:
+                logger.debug(
+                    "Final transcript detected, triggering invoke event"
+                )
+                await self.event_dispatcher.dispatch(
+                    INVOKE_EVENT, converted or data
+                )
+
+        # Handle UI subtypes and custom UI element responses
+        elif message_type == "custom_ui_element_response":
+            # Look the subtype up directly and treat any malformed content
+            # as having none, rather than checking each level first
+            try:
+                ui_subtype = data["content"]["type"]
+            except (KeyError, TypeError):
+                ui_subtype = None
+
+            if ui_subtype:
+                logger.debug("Dispatching to UI element type: %s", ui_subtype)
+                await self.event_dispatcher.dispatch(
+                    ui_subtype, converted or data
+                )
+
+        return True
 
     async def _main_loop(self) -> None:
         """
@@ -220,7 +289,8 @@ class AppRunner:
         This method manages the application's main lifecycle, including:
         - Initial connection establishment
         - Listening for incoming messages
-        - Handling reconnection attempts when connections fail
+        - Handling reconnection attempts when connections fail, with exponential
+          backoff while they keep failing
         - Cleaning up resources when the application is shutting down
         
         The loop continues running until the application is explicitly stopped
@@ -240,8 +310,15 @@ class AppRunner:
                 if not self.auto_reconnect or not self.app.running:
                     break
 
-                logger.info(f"Reconnecting in {self.reconnect_delay} seconds...")
-                await asyncio.sleep(self.reconnect_delay)
+                # Double the previous delay rather than raising to a power of
+                # the attempt count, which overflows once the backend has been
+                # unreachable long enough
+                delay = self._next_reconnect_delay
+                self._next_reconnect_delay = min(
+                    delay * 2, max(self.reconnect_delay, self.MAX_RECONNECT_DELAY)
+                )
+                logger.info("Reconnecting in %s seconds...", delay)
+                await asyncio.sleep(delay)
 
         finally:
             # Clean up on exit
@@ -283,8 +360,10 @@ class AppRunner:
         self.app = app
 
         # Set up signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._handle_signal)
-        signal.signal(signal.SIGTERM, self._handle_signal)
+        previous_handlers = {
+            sig: signal.signal(sig, self._handle_signal)
+            for sig in (signal.SIGINT, signal.SIGTERM)
+        }
 
         # Create a new event loop in this thread
         self.app.loop = asyncio.new_event_loop()
@@ -296,6 +375,8 @@ class AppRunner:
             self.app.loop.run_until_complete(self.app._main_task)
         except KeyboardInterrupt:
             logger.info("Application stopped by user")
+        except asyncio.CancelledError:
+            logger.info("Application stopped")
         finally:
             # Clean up
             self.app.running = False
@@ -311,3 +392,42 @@ class AppRunner:
             # Close the event loop
             self.app.loop.close()
             self.app.loop = None
+
+            # Restore the signal handlers that were active before running
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+
+    async def run_async(self, app):
+        """
+        Run the application on the current event loop.
+        
+        This is the non-blocking counterpart of run(). It runs the main loop
+        in the calling task and leaves the event loop and signal handling to
+        the caller, which allows several applications to share one loop.
+        
+        Args:
+            app: The application instance to run.
+            
+        Returns:
+            None
+            
+        Raises:
+            asyncio.CancelledError: If the calling task is cancelled from
+                                   outside rather than through app.stop().
+        """
+        self.app = app
+        self.app.loop = asyncio.get_running_loop()
+        self.app._main_task = asyncio.current_task()
+
+        try:
+            self.app.running = True
+            await self._main_loop()
+        except asyncio.CancelledError:
+            # app.stop() clears the running flag before cancelling the task
+            if self.app.running:
+                raise
+            logger.info("Application stopped")
+        finally:
+            self.app.running = False
+            self.app._main_task = None
+            self.app.loop = None
@@ -0,0 +1,86 @@
+"""
+JSON serialization helpers for WebSocket messages.
+
+This module provides the loads and dumps functions used for every message
+exchanged with the Framewise backend. When the optional orjson package is
+installed it is used for both, otherwise the standard library json module
+is used, configured to produce the same compact output as orjson. Both
+backends accept str or bytes input. dumps always returns a str, and
+dumps_bytes returns the same JSON encoded as UTF-8, which can be sent as a
+text frame without decoding it first.
+
+Usage example:
+    from framewise_meet_client.serialization import dumps, loads
+
+    payload = dumps({"type": "generated_text", "content": {"text": "Hi"}})
+    message = loads(raw_message)
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Raised by loads for malformed input, whichever backend is used
+JSONDecodeError = json.JSONDecodeError
+
+# Options that make the json fallback match orjson's output: no whitespace
+# after separators, and non-ASCII characters written as-is
+_JSON_OPTIONS = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text, as a str or UTF-8 encoded bytes.
+
+    Returns:
+        The parsed Python object.
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Args:
+        obj: JSON-serializable object to serialize.
+
+    Returns:
+        The JSON text of obj.
+
+    Raises:
+        TypeError: If obj contains values that cannot be serialized.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, **_JSON_OPTIONS)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object to serialize.
+
+    Returns:
+        The JSON of obj as UTF-8 bytes.
+
+    Raises:
+        TypeError: If obj contains values that cannot be serialized.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, **_JSON_OPTIONS).encode()
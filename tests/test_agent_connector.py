@@ -0,0 +1,259 @@
+import asyncio
+import json
+import multiprocessing
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from framewise_meet_client.agent_connector import AgentConnector, AgentState, _run_agent
+
+
+class FakeProcess:
+    """Stand-in for a multiprocessing.Process that never really starts."""
+
+    def __init__(self, target=None, args=(), name=None, daemon=None):
+        self.target = target
+        self.args = args
+        self.name = name
+        self.daemon = daemon
+        self.pid = 4242
+        self.exitcode = None
+        self.started = False
+        self.terminated = False
+        self.killed = False
+        # Whether terminate() ends the process, as it does for a well-behaved agent
+        self.stops_on_terminate = True
+
+    def start(self):
+        self.started = True
+
+    def is_alive(self):
+        return self.started and self.exitcode is None
+
+    def terminate(self):
+        self.terminated = True
+        if self.stops_on_terminate:
+            self.exitcode = -15
+
+    def kill(self):
+        self.killed = True
+        self.exitcode = -9
+
+
+class FakeApp:
+    """App object that records the meetings it joins."""
+
+    def __init__(self):
+        self.meetings = []
+
+    def join_meeting(self, meeting_id):
+        self.meetings.append(meeting_id)
+
+    def run(self, log_level=None):
+        pass
+
+    async def run_async(self):
+        await asyncio.sleep(3600)
+
+
+# Module-level app so that forked agent processes can use it
+quick_app = FakeApp()
+
+
+class TestAgentConnector(unittest.TestCase):
+    def setUp(self):
+        self.processes = []
+        self.connector = self._make_connector()
+
+    def _make_connector(self, **options):
+        connector = AgentConnector("test_key", {"quiz": FakeApp()}, start_method="fork", **options)
+        connector._mp_context = MagicMock()
+        connector._mp_context.Process.side_effect = self._new_process
+        return connector
+
+    def _new_process(self, **kwargs):
+        process = FakeProcess(**kwargs)
+        self.processes.append(process)
+        return process
+
+    def _records(self):
+        return list(self.connector.active_agents.values())
+
+    def test_start_runs_agent_in_own_process(self):
+        """Test that each started agent gets a process of its own."""
+        self.assertTrue(self.connector.start_agent_process("quiz", "m1"))
+        self.assertTrue(self.connector.start_agent_process("quiz", "m2"))
+
+        self.assertEqual(len(self.processes), 2)
+        self.assertTrue(all(process.started and process.daemon for process in self.processes))
+        self.assertIs(self.processes[0].target, _run_agent)
+        self.assertEqual(self.processes[0].args[2], "m1")
+        self.assertEqual([record.state for record in self._records()], [AgentState.RUNNING] * 2)
+
+    def test_unknown_agent_not_started(self):
+        """Test that start commands for unregistered agents are ignored."""
+        self.assertFalse(self.connector.start_agent_process("missing", "m1"))
+        self.assertEqual(self.connector.active_agents, {})
+
+    def test_duplicate_start_ignored(self):
+        """Test that an agent is started only once per meeting while it runs."""
+        self.assertTrue(self.connector.start_agent_process("quiz", "m1"))
+        self.assertFalse(self.connector.start_agent_process("quiz", "m1"))
+        self.assertEqual(len(self.processes), 1)
+
+        # Once the first run has finished, the meeting can be served again
+        self.processes[0].exitcode = 0
+        self.assertTrue(self.connector.start_agent_process("quiz", "m1"))
+
+    def test_start_waits_when_max_workers_running(self):
+        """Test that starts beyond max_workers wait for a free process slot."""
+        self.connector.max_workers = 1
+        self.connector.start_agent_process("quiz", "m1")
+
+        with self.assertLogs("AgentConnector", level="WARNING") as logs:
+            self.assertTrue(self.connector.start_agent_process("quiz", "m2"))
+
+        self.assertIn("waits for one to finish", logs.output[0])
+        self.assertEqual(len(self.processes), 1)
+        self.assertEqual(self._records()[1].state, AgentState.SPAWNED)
+
+    def test_reap_records_outcome_and_starts_waiting_agents(self):
+        """Test that reaping drops finished agents and fills the freed slots."""
+        self.connector.max_workers = 2
+        for meeting_id in ("m1", "m2", "m3"):
+            self.connector.start_agent_process("quiz", meeting_id)
+        first, second, third = self._records()
+
+        self.processes[0].exitcode = 0
+        self.processes[1].exitcode = 1
+        self.connector.reap_agents()
+
+        self.assertEqual(first.state, AgentState.COMPLETED)
+        self.assertEqual(second.state, AgentState.FAILED)
+        self.assertEqual(third.state, AgentState.RUNNING)
+        self.assertEqual(self._records(), [third])
+        self.assertEqual(len(self.processes), 3)
+
+    def test_capacity_rejection_notifies_backend(self):
+        """Test that start commands beyond max_agents are rejected."""
+        self.connector.max_agents = 1
+        self.connector.websocket = MagicMock(send=AsyncMock())
+
+        async def run():
+            await self.connector.handle_message(json.dumps({"agent_name": "quiz", "meeting_id": "m1"}))
+            await self.connector.handle_message(json.dumps({"agent_name": "quiz", "meeting_id": "m2"}))
+
+        asyncio.run(run())
+
+        self.assertEqual(len(self.processes), 1)
+        rejection = json.loads(self.connector.websocket.send.call_args.args[0])
+        self.assertEqual(rejection, {
+            "type": "agent_start_rejected",
+            "agent_name": "quiz",
+            "meeting_id": "m2",
+            "reason": "max_agents_reached",
+        })
+
+    def _run_until_done(self, connector, seconds):
+        async def run():
+            connector.start_agent_process("quiz", "m1")
+            await asyncio.sleep(seconds)
+            return self._records()[0]
+
+        return asyncio.run(run())
+
+    def test_lifetime_terminates_agent_process(self):
+        """Test that an agent running past max_agent_lifetime is asked to stop."""
+        self.connector.max_agent_lifetime = 0.05
+        self.connector.REAP_INTERVAL = 0.01
+
+        record = self._run_until_done(self.connector, 0.2)
+
+        self.assertEqual(record.state, AgentState.TIMED_OUT)
+        self.assertTrue(self.processes[0].terminated)
+        self.assertFalse(self.processes[0].killed)
+
+        self.connector.reap_agents()
+        self.assertEqual(record.state, AgentState.TIMED_OUT)
+        self.assertEqual(self.connector.active_agents, {})
+
+    def test_lifetime_kills_agent_that_ignores_terminate(self):
+        """Test that an agent still running after the grace period is killed."""
+        self.connector.max_agent_lifetime = 0.05
+        self.connector.REAP_INTERVAL = 0.01
+        self.connector.STOP_GRACE_PERIOD = 0.05
+        self.connector.max_workers = 1
+
+        async def run():
+            self.connector.start_agent_process("quiz", "m1")
+            self.connector.start_agent_process("quiz", "m2")
+            self.processes[0].stops_on_terminate = False
+            await asyncio.sleep(0.3)
+
+        asyncio.run(run())
+
+        self.assertTrue(self.processes[0].terminated)
+        self.assertTrue(self.processes[0].killed)
+        # The waiting agent is unaffected and starts once the slot is reaped
+        self.connector.reap_agents()
+        self.assertEqual(len(self.processes), 2)
+        self.assertFalse(self.processes[1].terminated)
+
+    def test_lifetime_cancels_task_agent(self):
+        """Test that an agent running as a task is cancelled when it times out."""
+        connector = self._make_connector(isolation="task", max_agent_lifetime=0.05)
+        connector.REAP_INTERVAL = 0.01
+        self.connector = connector
+
+        async def run():
+            connector.start_agent_process("quiz", "m1")
+            record = self._records()[0]
+            await asyncio.sleep(0.2)
+            return record
+
+        record = asyncio.run(run())
+
+        self.assertEqual(self.processes, [])
+        self.assertEqual(record.state, AgentState.TIMED_OUT)
+        self.assertTrue(record.task.cancelled())
+
+    def test_register_and_unregister_agent(self):
+        """Test that agents can be added and removed at runtime."""
+        self.connector.register_agent("support", FakeApp())
+        self.assertTrue(self.connector.start_agent_process("support", "m1"))
+
+        self.connector.unregister_agent("support")
+        self.assertFalse(self.connector.start_agent_process("support", "m2"))
+
+    def test_stop_terminates_agents(self):
+        """Test that stopping the connector ends running and waiting agents."""
+        self.connector.max_workers = 1
+        self.connector.start_agent_process("quiz", "m1")
+        self.connector.start_agent_process("quiz", "m2")
+
+        self.connector.stop()
+
+        self.assertTrue(self.processes[0].terminated)
+        self.assertEqual(self.connector.active_agents, {})
+        self.connector.reap_agents()
+        self.assertEqual(len(self.processes), 1)
+
+    @unittest.skipUnless(
+        "fork" in multiprocessing.get_all_start_methods(), "needs the fork start method"
+    )
+    def test_agent_runs_in_real_process(self):
+        """Test that an agent process runs the agent and is reaped as COMPLETED."""
+        connector = AgentConnector("test_key", {"quick": quick_app}, start_method="fork")
+        connector.start_agent_process("quick", "m1")
+        record = next(iter(connector.active_agents.values()))
+        record.process.join(10)
+
+        connector.reap_agents()
+
+        self.assertEqual(record.state, AgentState.COMPLETED)
+        self.assertEqual(connector.active_agents, {})
+        # The agent ran in its own process, so the parent's app is untouched
+        self.assertEqual(quick_app.meetings, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
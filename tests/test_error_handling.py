@@ -1,8 +1,10 @@
+import asyncio
 import unittest
 from unittest.mock import Mock, patch
 import json
 
 from framewise_meet_client.error_handling import safe_model_validate, extract_message_content_safely
+from framewise_meet_client.event_handler import EventDispatcher
 from framewise_meet_client.models.inbound import TranscriptMessage, CustomUIElementResponse
 from pydantic import BaseModel, Field
 
@@ -79,5 +81,35 @@ class TestErrorHandling(unittest.TestCase):
         result = extract_message_content_safely(message, "text", default_value="default")
         self.assertEqual(result, "default")
 
+    def test_failing_handler_errors_are_throttled(self):
+        """Test that repeated handler errors stop being logged at error level."""
+        dispatcher = EventDispatcher()
+        dispatcher.MAX_LOGGED_FAILURES = 3
+        calls = []
+
+        async def failing_handler(message):
+            calls.append(message)
+            raise ValueError("broken handler")
+
+        dispatcher.register("transcript", failing_handler)
+
+        async def dispatch_all():
+            for _ in range(5):
+                await dispatcher.dispatch("transcript", {"type": "transcript"})
+
+        with self.assertLogs("framewise_meet_client.event_handler", level="DEBUG") as logs:
+            asyncio.run(dispatch_all())
+
+        self.assertEqual(len(calls), 5)
+        error_records = [r for r in logs.records if r.levelname == "ERROR"]
+        debug_errors = [
+            r for r in logs.records
+            if r.levelname == "DEBUG" and r.getMessage().startswith("Error in handler")
+        ]
+        # Three tracebacks plus the notice that further errors go to debug
+        self.assertEqual(len(error_records), 4)
+        self.assertIsNotNone(error_records[0].exc_info)
+        self.assertEqual(len(debug_errors), 2)
+
 if __name__ == '__main__':
     unittest.main()
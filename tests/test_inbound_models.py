@@ -0,0 +1,33 @@
+import unittest
+
+from framewise_meet_client.models.inbound import (
+    CustomUIElementResponse,
+    ConsentFormResponseData,
+    MCQQuestionResponseData,
+)
+
+
+class TestCustomUIContent(unittest.TestCase):
+    def _parse(self, element_type, data):
+        return CustomUIElementResponse.model_validate({
+            "type": "custom_ui_element_response",
+            "content": {"type": element_type, "data": data},
+        })
+
+    def test_data_parsed_by_element_type(self):
+        """Test that UI response data is parsed into the model of its element type."""
+        message = self._parse("mcq_question", {"id": "q1", "selectedOption": "Blue", "selectedIndex": 2})
+        self.assertIsInstance(message.content.data, MCQQuestionResponseData)
+        self.assertEqual(message.content.data.selectedIndex, 2)
+
+        message = self._parse("consent_form", {"id": "c1", "text": "Agree?", "isChecked": True})
+        self.assertIsInstance(message.content.data, ConsentFormResponseData)
+
+    def test_unknown_element_type_keeps_dict(self):
+        """Test that data of unknown element types is kept as a dictionary."""
+        message = self._parse("custom_chart", {"id": "chart1"})
+        self.assertEqual(message.content.data, {"id": "chart1"})
+
+
+if __name__ == '__main__':
+    unittest.main()
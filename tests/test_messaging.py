@@ -22,6 +22,7 @@ class TestMessageSender(unittest.TestCase):
         self.mock_connection = MagicMock()
         self.mock_connection.connected = True
         self.mock_connection.send = AsyncMock()
+        self.mock_connection.send_text = AsyncMock()
         
         # Create the MessageSender with the mock connection
         self.sender = MessageSender(self.mock_connection)
@@ -130,8 +131,7 @@ class TestMessageSender(unittest.TestCase):
         # Verify create_task was called
         self.assertEqual(mock_create_task.call_count, 1)
 
-    @patch('asyncio.run_coroutine_threadsafe')
-    def test_send_with_custom_loop(self, mock_run_coroutine):
+    def test_send_with_custom_loop(self):
         """Test sending a message with a custom event loop."""
         # Create a mock loop
         mock_loop = MagicMock()
@@ -144,9 +144,11 @@ class TestMessageSender(unittest.TestCase):
             loop=mock_loop
         )
         
-        # Verify run_coroutine_threadsafe was called with the mock loop
-        self.assertEqual(mock_run_coroutine.call_count, 1)
-        self.assertEqual(mock_run_coroutine.call_args[0][1], mock_loop)
+        # Verify the message was handed to the mock loop to be queued
+        self.assertEqual(mock_loop.call_soon_threadsafe.call_count, 1)
+        callback, message = mock_loop.call_soon_threadsafe.call_args[0]
+        self.assertEqual(callback, self.sender._send_after_generated_text)
+        self.assertEqual(json.loads(message)["content"]["type"], "mcq_question")
 
     async def _test_send_model_implementation(self):
         """Test the actual implementation of _send_model."""
@@ -233,5 +235,80 @@ class TestMessageSender(unittest.TestCase):
         finally:
             loop.close()
 
+    async def _test_send_generated_text_coalesces_chunks(self):
+        self.sender.send_generated_text("Hello, ", is_generation_end=False)
+        self.sender.send_generated_text("how are ", is_generation_end=False)
+        self.sender.send_generated_text("you?", is_generation_end=True)
+        self.sender.send_generated_text("Still there?", is_generation_end=False)
+        await asyncio.sleep(self.sender.GENERATED_TEXT_FLUSH_DELAY * 5)
+
+        messages = [json.loads(call.args[0]) for call in self.mock_connection.send_text.call_args_list]
+        self.assertTrue(all(message["type"] == "generated_text" for message in messages))
+        contents = [message["content"] for message in messages]
+        self.assertEqual(contents, [
+            {"text": "Hello, how are you?", "is_generation_end": True},
+            {"text": "Still there?", "is_generation_end": False},
+        ])
+
+    def test_send_generated_text_coalesces_chunks(self):
+        """Test that consecutive generated text chunks are sent as one message."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._test_send_generated_text_coalesces_chunks())
+        finally:
+            loop.close()
+
+    async def _test_send_generated_text_awaitable(self):
+        await self.sender.send_generated_text("Hello", is_generation_end=True)
+        await asyncio.sleep(0)
+
+        message = json.loads(self.mock_connection.send_text.call_args.args[0])
+        self.assertEqual(message["content"]["text"], "Hello")
+
+    def test_send_generated_text_awaitable(self):
+        """Test that send_generated_text can still be awaited."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._test_send_generated_text_awaitable())
+        finally:
+            loop.close()
+
+    async def _test_messages_sent_in_order(self):
+        self.sender.send_generated_text("Let me ask you something.", is_generation_end=True)
+        self.sender.send_mcq_question("q1", "Pick one", ["A", "B"])
+        self.sender.send_error("Something went wrong")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        self.assertIsNone(self.sender._writer)
+        self.assertEqual(len(self.sender._outbox), 0)
+        texts = [json.loads(call.args[0]) for call in self.mock_connection.send_text.call_args_list]
+        self.assertEqual([message["type"] for message in texts], ["generated_text", "custom_ui_element"])
+        self.assertEqual(texts[0]["content"]["text"], "Let me ask you something.")
+        self.assertEqual(texts[1]["content"]["data"]["options"], ["A", "B"])
+        self.mock_connection.send.assert_called_once()
+        self.assertEqual(self.mock_connection.send.call_args[0][0]["type"], "error")
+
+    def test_messages_sent_in_order(self):
+        """Test that queued messages are sent in order by one writer task."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            with patch('asyncio.create_task', wraps=asyncio.create_task) as mock_create_task:
+                loop.run_until_complete(self._test_messages_sent_in_order())
+            self.assertEqual(mock_create_task.call_count, 1)
+        finally:
+            loop.close()
+
+    def test_proxied_methods_cover_public_send_methods(self):
+        """Test that every public send method is listed for App to expose."""
+        public_methods = {
+            name for name in dir(MessageSender)
+            if not name.startswith("_") and callable(getattr(MessageSender, name))
+        }
+        self.assertEqual(set(MessageSender.PROXIED_METHODS), public_methods)
+
 if __name__ == '__main__':
     unittest.main()